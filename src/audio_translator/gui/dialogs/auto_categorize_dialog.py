@@ -15,11 +15,13 @@ import logging
 from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
 import threading
-import time
 
 # 设置日志记录器
 logger = logging.getLogger(__name__)
 
+# 处理文件时每隔多少个文件刷新一次进度
+PROGRESS_UPDATE_INTERVAL = 64
+
 class AutoCategorizeDialog:
     """
     自动分类对话框
@@ -197,13 +199,17 @@ class AutoCategorizeDialog:
             total_files = len(self.files)
             
             for i, file_path in enumerate(self.files):
-                # 更新进度
-                progress = (i / total_files) * 100
-                self.progress_var.set(progress)
-                
-                # 更新状态
+                # 对话框已关闭时停止分析
+                if self.stop_flag:
+                    return
+                    
                 filename = os.path.basename(file_path)
-                self.status_var.set(f"正在分析: {filename}")
+                
+                # 每隔一段更新一次进度和状态，避免逐个文件触发重绘
+                if i % PROGRESS_UPDATE_INTERVAL == 0:
+                    progress = (i / total_files) * 100
+                    self.progress_var.set(progress)
+                    self.status_var.set(f"正在分析: {filename} ({i + 1}/{total_files})")
                 
                 # 猜测分类
                 cat_id = self.category_service.guess_category(filename)
@@ -244,9 +250,6 @@ class AutoCategorizeDialog:
                         'end', 
                         values=(filename, 'OTHER', '其他')
                     )
-                
-                # 短暂延迟，避免UI卡顿
-                time.sleep(0.01)
             
             # 完成分析
             self.progress_var.set(100)
@@ -351,13 +354,13 @@ class AutoCategorizeDialog:
             total_files = len(self.files)
             
             for i, file_path in enumerate(self.files):
-                # 更新进度
-                progress = (i / total_files) * 100
-                self.progress_var.set(progress)
-                
-                # 更新状态
-                filename = os.path.basename(file_path)
-                self.status_var.set(f"正在处理: {filename}")
+                # 每隔一段更新一次进度和状态，避免逐个文件触发重绘
+                if i % PROGRESS_UPDATE_INTERVAL == 0:
+                    progress = (i / total_files) * 100
+                    self.progress_var.set(progress)
+                    
+                    filename = os.path.basename(file_path)
+                    self.status_var.set(f"正在处理: {filename} ({i + 1}/{total_files})")
                 
                 # 获取分类信息
                 category_info = self.categorization_results.get(file_path, {})
@@ -376,9 +379,6 @@ class AutoCategorizeDialog:
                         logger.info(f"文件已移动: {file_path} -> {target_path}")
                 except Exception as e:
                     logger.error(f"移动文件失败 {file_path}: {e}")
-                
-                # 短暂延迟，避免UI卡顿
-                time.sleep(0.01)
             
             # 完成处理
             self.progress_var.set(100)
@@ -421,4 +421,8 @@ class AutoCategorizeDialog:
         # 等待对话框关闭
         self.parent.wait_window(self.dialog)
         
+        # 对话框关闭后停止分析线程，并释放预览数据
+        self.stop_flag = True
+        self.categorization_results = {}
+        
         return self.result 
\ No newline at end of file
@@ -423,4 +423,8 @@ class CategorySelectionDialog:
         # 等待对话框关闭
         self.parent.wait_window(self.dialog)
         
+        # 对话框关闭后释放分类和文件列表
+        self.categories = None
+        self.files = None
+        
         return self.result 
\ No newline at end of file
@@ -12,32 +12,193 @@
 import os
 import sys
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, simpledialog
+from tkinter import ttk, messagebox, simpledialog
 import logging
+import dataclasses
+import functools
+import importlib
+import itertools
+import time
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Tuple, Union
-import platform
-import subprocess
+from types import MappingProxyType
+from typing import List, Dict, Optional, Any, Set, Tuple, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 
 # 导入管理器
 from ..managers.file_manager import FileManager
 from ..managers.category_manager import CategoryManager
-from ..gui.dialogs.category_selection_dialog import CategorySelectionDialog
-from ..gui.dialogs.auto_categorize_dialog import AutoCategorizeDialog
-from ..services.core.service_manager_service import ServiceManagerService
-from ..services.api.model_service import ModelService
-from ..gui.panels.service_manager_panel import ServiceManagerPanel
+from ..services.business.category.category import Category
 from ..gui.panels.file_manager_panel import FileManagerPanel
 from ..services.core.service_factory import ServiceFactory
-from ..utils.ui_utils import create_tooltip
-from ..gui.dialogs.translation.translation_strategy_ui import create_translation_strategy_dialog
-from ..gui.dialogs.naming.naming_rule_ui import create_naming_rule_dialog
+from ..utils.ui_utils import create_tooltip, treeview_bulk_insert
 # 设置日志记录器
 logger = logging.getLogger(__name__)
 
+# 各平台使用的ttk主题，启动时按当前系统解析一次
+_TTK_THEME = {
+    "win32": "vista",
+    "darwin": "aqua",  # macOS
+}.get(sys.platform, "clam")  # Linux
+
+# 没有主题服务时使用的默认颜色方案
+DEFAULT_COLORS = MappingProxyType({
+    'bg_dark': '#212121',  # 深色背景
+    'bg_light': '#333333',  # 稍亮的背景
+    'bg_accent': '#424242',  # 强调背景
+    'bg_alternate': '#292929',  # 交替背景（比bg_light稍暗）
+    'fg': '#FFFFFF',        # 前景文本颜色
+    'accent': '#2196F3',    # 强调色
+    'highlight': '#5E5E5E', # 高亮色
+    'active': '#1976D2',    # 激活状态颜色
+    'hover': '#484848',     # 悬浮状态颜色
+    'selected': '#1976D2',  # 选中状态颜色
+    'border': '#555555',    # 边框颜色
+})
+
+# 记录已应用的样式颜色方案的Tcl全局变量名
+STYLE_KEY_VAR = "audio_translator_style_key"
+
+# 主窗口使用的服务：(属性名, 服务工厂的专用获取方法)，专用方法获取失败时按名称获取
+SERVICE_SPEC = (
+    ("file_service", "get_file_service"),
+    ("audio_service", "get_audio_service"),
+    ("translator_service", "get_translator_service"),
+    ("ucs_service", None),
+    ("category_service", "get_category_service"),
+)
+
+# 合并刷新请求的延迟（毫秒）
+REFRESH_DEBOUNCE_MS = 100
+
+# 窗口大小停止变化多久后才处理（毫秒）
+RESIZE_DEBOUNCE_MS = 100
+
+# 分类选择变化后更新分类信息的延迟（毫秒），按住方向键连续切换时只处理最后一次
+SELECTION_DEBOUNCE_MS = 30
+
+# 检查后台文件移动、分类服务调用是否完成的间隔（毫秒）
+MOVE_POLL_MS = 20
+
+# 状态栏通知自动清除的延迟（毫秒）
+NOTIFY_CLEAR_MS = 3000
+
+# 关闭时检查服务是否已关闭的间隔（毫秒），以及最长等待时间（秒）
+SHUTDOWN_POLL_MS = 100
+SHUTDOWN_TIMEOUT = 5.0
+
+# 相同选择的自动分类在该时间内（秒）重复触发时跳过
+AUTO_CATEGORIZE_REPEAT_WINDOW = 5.0
+
+# 一次取回分类树节点的名称、值、父节点ID和父节点名称的Tcl匿名函数
+_NODE_INFO_LAMBDA = (
+    "{w id} {set p [$w parent $id]; "
+    "list [$w item $id -text] [$w item $id -values] $p "
+    "[expr {$p eq \"\" ? \"\" : [$w item $p -text]}]}"
+)
+
+# 分类树中未展开分支的占位子节点ID前缀，展开时替换为真实的子分类
+LAZY_NODE_PREFIX = "__lazy__"
+
+# 应用资源目录
+ASSETS_DIR = Path(__file__).resolve().parents[3] / "assets"
+
+
+def _category_sort_key(category) -> str:
+    """分类树中同级分类的排序键：按中文名称（不区分大小写，混排的西文名称使用 casefold 比较）"""
+    return getattr(category, 'name_zh', '').casefold()
+
+
+@functools.lru_cache(maxsize=32)
+def _alternate_color(base_color: str) -> str:
+    """
+    根据基础颜色生成交替行颜色
+    
+    Args:
+        base_color: 基础颜色，格式为#RRGGBB
+        
+    Returns:
+        交替行颜色，格式为#RRGGBB
+    """
+    try:
+        # 将颜色转换为RGB值
+        r = int(base_color[1:3], 16)
+        g = int(base_color[3:5], 16)
+        b = int(base_color[5:7], 16)
+        
+        # 判断是否是暗色
+        is_dark = (r + g + b) < 384  # 128 * 3
+        
+        # 对暗色，稍微变亮；对亮色，稍微变暗
+        if is_dark:
+            # 变亮10%
+            r = min(255, r + 25)
+            g = min(255, g + 25)
+            b = min(255, b + 25)
+        else:
+            # 变暗10%
+            r = max(0, r - 25)
+            g = max(0, g - 25)
+            b = max(0, b - 25)
+        
+        # 转换回十六进制颜色
+        return f"#{r:02x}{g:02x}{b:02x}"
+    except Exception as e:
+        logger.warning("生成交替行颜色失败: %s", e)
+        # 默认返回略微不同的颜色
+        if base_color.startswith('#'):
+            # 简单地修改颜色，使其稍有不同
+            if base_color[1] < 'c':
+                return '#' + chr(ord(base_color[1]) + 1) + base_color[2:]
+            else:
+                return '#' + chr(ord(base_color[1]) - 1) + base_color[2:]
+        return "#333333"  # 默认暗色
+
+
+@functools.lru_cache(maxsize=None)
+def _find_app_icon() -> Optional[Path]:
+    """查找应用程序图标，优先 .ico (Windows)，其次 .png (macOS/Linux)"""
+    for name in ("icon.ico", "icon.png"):
+        icon_path = ASSETS_DIR / name
+        if icon_path.exists():
+            return icon_path
+    return None
+
+
 class AudioTranslatorGUI:
     """音效文件翻译器GUI类"""
     
+    # 实例属性固定，使用 __slots__ 省去每个实例的 __dict__，新增属性时需在此登记
+    __slots__ = (
+        # 服务与管理器
+        "root", "service_factory", "services_status", "theme_service", "file_service",
+        "audio_service", "translator_service", "ucs_service", "category_service",
+        "service_manager", "config_service", "file_manager", "category_manager",
+        # 状态变量
+        "current_directory", "status_message", "selected_files", "COLORS",
+        "tree_odd_row", "tree_even_row", "strategy_info", "search_var", "status_filter_var",
+        "category_path_var", "category_count_var", "category_type_var",
+        # 界面组件
+        "main_frame", "notebook", "file_tab", "service_tab", "_tab_texts", "file_area", "category_area",
+        "file_manager_panel", "service_manager_panel", "category_tree", "category_title_label",
+        "search_entry",
+        "strategy_button", "naming_rule_button", "add_category_btn", "del_category_btn",
+        "categorize_btn", "auto_categorize_btn",
+        "menu_bar", "file_menu", "edit_menu", "tools_menu",
+        # 内部状态
+        "_service_panel_built", "_resize_after_id", "_window_size", "_pending_refreshes",
+        "_refresh_after_id", "_category_iid_counter", "_io_executor", "_category_executor",
+        "_move_future",
+        "_closing", "_notify_clear_id", "_dialog_classes", "_categories_cache",
+        "_categories_cache_version", "_category_tree_version", "_last_auto_selection",
+        "_last_auto_time", "_cat_name_index", "_node_cat_ids", "_lazy_nodes",
+        "_category_context_menu", "_ctx_item", "_selection_refresh_id",
+        "_subcategory_snapshot", "_last_refresh_mtime",
+        "_cached_dialogs",
+    )
+    
+    # 已解码的应用图标，在实例之间复用
+    _icon_img: Optional[tk.PhotoImage] = None
+    
     def __init__(self, root: tk.Tk, service_factory: ServiceFactory):
         """
         初始化主窗口
@@ -63,163 +224,44 @@ class AudioTranslatorGUI:
         # 设置应用程序图标
         self._set_app_icon()
         
-        # 跟踪服务状态
-        self.services_status = {
-            "file_service": False,
-            "audio_service": False,
-            "translator_service": False,
-            "category_service": False,
-            "ucs_service": False
-        }
-        
-        # 获取基础服务
-        self.service_factory = service_factory
-        
-        # 确保使用单例实例
-        from ..services.core.service_factory import ServiceFactory
+        # 获取基础服务，确保使用单例实例
         singleton_factory = ServiceFactory.get_instance()
         if singleton_factory is not service_factory:
             logger.warning("检测到ServiceFactory实例不一致，将使用单例实例")
-            self.service_factory = singleton_factory
             service_factory = singleton_factory
+        self.service_factory = service_factory
         
         # 获取主题服务
-        try:
-            self.theme_service = service_factory.get_service('theme_service')
-            if self.theme_service:
-                logger.info("成功获取theme_service")
-            else:
-                logger.warning("未能获取theme_service，将使用默认主题")
-        except Exception as e:
-            logger.error(f"获取主题服务失败: {e}")
-            self.theme_service = None
-
-        # 获取文件服务
-        try:
-            self.file_service = service_factory.get_file_service()
-            if self.file_service:
-                self.services_status["file_service"] = True
-                logger.info("成功获取file_service")
-            else:
-                # 尝试直接从单例获取
-                self.file_service = service_factory.get_service('file_service')
-                if self.file_service:
-                    self.services_status["file_service"] = True
-                    logger.info("通过get_service方法成功获取file_service")
-        except Exception as e:
-            logger.error(f"获取文件服务失败: {e}")
-            self.file_service = None
-            
-        # 获取音频服务
-        try:
-            self.audio_service = service_factory.get_audio_service()
-            if self.audio_service:
-                self.services_status["audio_service"] = True
-                logger.info("成功获取audio_service")
-            else:
-                # 尝试直接从单例获取
-                self.audio_service = service_factory.get_service('audio_service')
-                if self.audio_service:
-                    self.services_status["audio_service"] = True
-                    logger.info("通过get_service方法成功获取audio_service")
-        except Exception as e:
-            logger.error(f"获取音频服务失败: {e}")
-            self.audio_service = None
-        
-        # 获取翻译服务
-        try:
-            self.translator_service = service_factory.get_translator_service()
-            if self.translator_service:
-                self.services_status["translator_service"] = True
-                logger.info("成功获取translator_service")
-            else:
-                # 尝试直接通过get_service获取
-                self.translator_service = service_factory.get_service('translator_service')
-                if self.translator_service:
-                    self.services_status["translator_service"] = True
-                    logger.info("通过get_service方法成功获取translator_service")
-                else:
-                    logger.warning("无法获取翻译服务，翻译功能可能无法正常工作")
-        except Exception as e:
-            logger.warning(f"获取翻译服务时发生错误: {e}，翻译功能可能无法正常工作")
-            self.translator_service = None
-        
-        # 检查基础服务
+        self.theme_service = self._resolve_service(service_factory, 'theme_service')
+        if not self.theme_service:
+            logger.warning("未能获取theme_service，将使用默认主题")
+        
+        # 获取各项服务并跟踪服务状态
+        self.services_status = {}
+        for name, getter in SERVICE_SPEC:
+            service = self._resolve_service(service_factory, name, getter)
+            setattr(self, name, service)
+            self.services_status[name] = service is not None
+        
+        # 获取结果汇总为一条日志，缺失的服务另外给出提示
+        logger.info("服务获取结果: %s", self.services_status)
         if not self.file_service or not self.audio_service:
             logger.error("无法获取基础服务，应用程序可能无法正常工作")
-            # 尝试从单例实例获取
-            try:
-                from ..services.core.service_factory import ServiceFactory
-                singleton_factory = ServiceFactory.get_instance()
-                if singleton_factory and singleton_factory != service_factory:
-                    if not self.file_service:
-                        self.file_service = singleton_factory.get_file_service()
-                        if self.file_service:
-                            self.services_status["file_service"] = True
-                            logger.info("从单例实例成功获取file_service")
-                    
-                    if not self.audio_service:
-                        self.audio_service = singleton_factory.get_audio_service()
-                        if self.audio_service:
-                            self.services_status["audio_service"] = True
-                            logger.info("从单例实例成功获取audio_service")
-            except Exception as e:
-                logger.error(f"尝试从单例获取基础服务时发生错误: {e}")
+        if not self.translator_service:
+            logger.warning("无法获取翻译服务，翻译功能可能无法正常工作")
+        if not self.ucs_service:
+            logger.error("无法获取UCS服务，分类功能可能无法正常工作")
+        
+        # 如果无法获取分类服务，首次加载分类树时再创建新实例，避免在窗口显示前读取分类数据
+        if not self.category_service:
+            logger.warning("无法获取分类服务，将在首次加载分类树时创建新实例")
         
         # 初始化管理器
         self.file_manager = FileManager()
         
-        # 获取UCS服务实例用于分类管理
-        try:
-            self.ucs_service = service_factory.get_service("ucs_service")
-            if self.ucs_service:
-                self.services_status["ucs_service"] = True
-                logger.info("成功获取ucs_service")
-            else:
-                logger.error("无法获取UCS服务，分类功能可能无法正常工作")
-        except Exception as e:
-            logger.error(f"获取UCS服务失败: {e}")
-            self.ucs_service = None
-        
-        # 获取分类服务
-        try:
-            self.category_service = service_factory.get_category_service()
-            if self.category_service:
-                self.services_status["category_service"] = True
-                logger.info("成功获取category_service")
-        
-            # 如果通过常规方式获取失败，尝试从单例实例获取
-            if not self.category_service:
-                logger.warning("通过传入的service_factory获取category_service失败，尝试从单例实例获取")
-                from ..services.core.service_factory import ServiceFactory
-                singleton_factory = ServiceFactory.get_instance()
-                if singleton_factory and singleton_factory != service_factory:
-                    self.category_service = singleton_factory.get_category_service()
-                    if self.category_service:
-                        self.services_status["category_service"] = True
-                        logger.info("从单例实例成功获取category_service")
-            
-            # 如果依然无法获取，尝试直接创建一个分类服务实例
-            if not self.category_service:
-                logger.warning("无法获取分类服务，尝试创建新实例")
-                from ..services.business.category.category_service import CategoryService
-                self.category_service = CategoryService()
-                
-                # 初始化新创建的分类服务
-                if self.category_service.initialize():
-                    self.services_status["category_service"] = True
-                    logger.info("成功创建并初始化category_service")
-                    
-                    # 注册到服务工厂
-                    service_factory.register_service(self.category_service)
-                    logger.info("已将新创建的category_service注册到服务工厂")
-                    
-        except Exception as e:
-            logger.error(f"获取分类服务失败: {e}")
-            self.category_service = None
-            
-        # 显示服务状态消息
-        self._show_services_status()
+        # 预先获取界面会反复用到的服务，避免每次操作时再查找
+        self.service_manager = service_factory.get_service("service_manager_service")
+        self.config_service = service_factory.get_service("config_service")
         
         # 初始化分类管理器并传入根窗口
         self.category_manager = CategoryManager(self.root)
@@ -227,15 +269,72 @@ class AudioTranslatorGUI:
         # 设置分类服务
         if self.category_service:
             self.category_manager.set_category_service(self.category_service)
-        else:
-            logger.error("分类服务未设置")
-            messagebox.showwarning("警告", "分类服务未设置，分类功能可能无法正常工作")
         
         # 初始化变量
         self.current_directory = tk.StringVar(value=str(self.file_manager.current_directory))
         self.status_message = tk.StringVar(value="就绪")
         self.selected_files = []
         
+        # 界面组件占位，创建后才会被赋值，使用前判断是否为None即可
+        self.file_manager_panel: Optional[FileManagerPanel] = None
+        self.category_tree: Optional[ttk.Treeview] = None
+        self.service_manager_panel: Optional[ttk.Frame] = None
+        self._service_panel_built = False
+        self.strategy_info: Optional[tk.StringVar] = None
+        self.tree_odd_row: Optional[str] = None
+        self.tree_even_row: Optional[str] = None
+        
+        # 窗口大小变化处理状态
+        self._resize_after_id: Optional[str] = None
+        self._window_size = (0, 0)
+        
+        # 待执行的分类信息更新
+        self._selection_refresh_id: Optional[str] = None
+        
+        # 上次加载时各目录的修改时间（纳秒），目录未变化时刷新可以跳过重新加载
+        self._last_refresh_mtime: Dict[str, int] = {}
+        
+        # 待执行的刷新（ui / file_tree / category_tree），短时间内的多次请求合并为一次
+        self._pending_refreshes: Set[str] = set()
+        self._refresh_after_id: Optional[str] = None
+        
+        # 分类树节点ID生成器
+        self._category_iid_counter = itertools.count()
+        # 分类树名称索引：父节点ID -> {分类名称: 节点ID}，用于名称查重
+        self._cat_name_index: Dict[str, Dict[str, str]] = {}
+        # 分类树节点ID -> 分类服务中的分类ID，用于修改和删除分类
+        self._node_cat_ids: Dict[str, str] = {}
+        # 尚未展开的分类节点：节点ID -> (分类ID, 子节点深度)
+        self._lazy_nodes: Dict[str, Tuple[str, int]] = {}
+        # 本次填充分类树期间已排序的子分类：分类ID -> 子分类列表
+        self._subcategory_snapshot: Dict[str, List[Any]] = {}
+        
+        # 文件移动等耗时的文件系统操作在后台线程中执行
+        self._io_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="file-io")
+        # 分类的增删改会修改并保存整个分类表，使用单个线程依次执行
+        self._category_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="category-op")
+        self._move_future: Optional[Future] = None
+        self._closing = False
+        
+        # 状态栏通知的自动清除定时器
+        self._notify_clear_id: Optional[str] = None
+        
+        # 按需导入的对话框类，首次使用时导入并缓存
+        self._dialog_classes: Dict[str, type] = {}
+        # 关闭后隐藏而不销毁的对话框：缓存键 -> (创建时使用的服务, 对话框)
+        self._cached_dialogs: Dict[str, Tuple[Any, tk.Toplevel]] = {}
+        
+        # 分类数据缓存及其对应的分类数据版本号
+        self._categories_cache: Optional[Dict[str, Any]] = None
+        self._categories_cache_version = -1
+        
+        # 分类树当前显示的分类数据版本号，用于跳过无变化的重建
+        self._category_tree_version = -1
+        
+        # 上一次成功自动分类的文件选择及完成时间，用于跳过误触的重复分类
+        self._last_auto_selection: Optional[frozenset] = None
+        self._last_auto_time = 0.0
+        
         # 设置样式
         self._setup_styles()
         
@@ -248,33 +347,74 @@ class AudioTranslatorGUI:
         # 设置窗口关闭处理
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         
-        # 创建菜单
-        self._create_menus()
+        # 窗口先完成首次绘制，较重的面板、分类树和菜单在空闲时再创建
+        self.root.after_idle(self._finish_ui)
         
         logger.info("主窗口初始化完成")
     
+    @staticmethod
+    def _resolve_service(service_factory: ServiceFactory, name: str,
+                         getter: Optional[str] = None) -> Any:
+        """
+        从服务工厂获取服务
+        
+        Args:
+            service_factory: 服务工厂
+            name: 服务名称
+            getter: 服务工厂的专用获取方法名，获取失败时再按名称获取
+            
+        Returns:
+            服务实例，无法获取时返回None
+        """
+        try:
+            service = getattr(service_factory, getter)() if getter else None
+            if not service:
+                service = service_factory.get_service(name)
+            if service:
+                return service
+        except Exception as e:
+            logger.error("获取服务 %s 失败: %s", name, e)
+        return None
+    
     def _set_app_icon(self):
         """设置应用程序图标"""
         try:
-            # 尝试设置 .ico 格式图标 (Windows)
-            icon_path = Path(__file__).parent.parent.parent.parent / "assets" / "icon.ico"
-            if icon_path.exists():
-                self.root.iconbitmap(str(icon_path))
+            icon_path = _find_app_icon()
+            if icon_path is None:
                 return
             
-            # 尝试设置 .png 格式图标 (macOS/Linux)
-            icon_path = Path(__file__).parent.parent.parent.parent / "assets" / "icon.png"
-            if icon_path.exists():
-                img = tk.PhotoImage(file=str(icon_path))
-                self.root.iconphoto(True, img)
+            # .ico 格式图标 (Windows)
+            if icon_path.suffix == ".ico":
+                self.root.iconbitmap(str(icon_path))
                 return
+            
+            # .png 格式图标 (macOS/Linux)，解码较慢，等窗口显示后再加载
+            # 定时事件先于空闲任务处理，after(0) 会在窗口映射前解码，因此使用 after_idle
+            self.root.after_idle(self._apply_png_icon, icon_path)
         except Exception as e:
-            logger.warning(f"设置应用程序图标失败: {e}")
+            logger.warning("设置应用程序图标失败: %s", e)
+    
+    def _apply_png_icon(self, icon_path: Path):
+        """
+        加载并设置PNG格式的应用程序图标
+        
+        Args:
+            icon_path: 图标文件路径
+        """
+        try:
+            # 同一Tk解释器内只解码一次，引用保存在类上以免图片被回收
+            img = AudioTranslatorGUI._icon_img
+            if img is None or img.tk is not self.root.tk:
+                img = tk.PhotoImage(master=self.root, file=str(icon_path))
+                AudioTranslatorGUI._icon_img = img
+            self.root.iconphoto(True, img)
+        except Exception as e:
+            logger.warning("设置应用程序图标失败: %s", e)
     
     def _setup_styles(self):
         """设置UI样式"""
         # 如果有主题服务，使用主题服务的颜色设置
-        if hasattr(self, 'theme_service') and self.theme_service:
+        if self.theme_service:
             current_theme = self.theme_service.get_current_theme()
             theme_colors = self.theme_service.get_theme_colors(current_theme)
             
@@ -283,7 +423,7 @@ class AudioTranslatorGUI:
                 'bg_dark': theme_colors['bg_dark'],
                 'bg_light': theme_colors['bg_light'],
                 'bg_accent': theme_colors.get('bg_accent', theme_colors['bg_light']),
-                'bg_alternate': theme_colors.get('bg_alternate', self._get_alternate_color(theme_colors['bg_light'])),
+                'bg_alternate': theme_colors.get('bg_alternate') or _alternate_color(theme_colors['bg_light']),
                 'fg': theme_colors['fg'],
                 'accent': theme_colors['accent'],
                 'highlight': theme_colors.get('highlight', theme_colors['border']),
@@ -296,252 +436,108 @@ class AudioTranslatorGUI:
             # 应用主题到窗口
             self.theme_service.setup_window_theme(self.root, current_theme)
         else:
-            # 使用硬编码的默认颜色方案
-            self.COLORS = {
-                'bg_dark': '#212121',  # 深色背景
-                'bg_light': '#333333',  # 稍亮的背景
-                'bg_accent': '#424242',  # 强调背景
-                'bg_alternate': '#292929',  # 交替背景（比bg_light稍暗）
-                'fg': '#FFFFFF',        # 前景文本颜色
-                'accent': '#2196F3',    # 强调色
-                'highlight': '#5E5E5E', # 高亮色
-                'active': '#1976D2',    # 激活状态颜色
-                'hover': '#484848',     # 悬浮状态颜色
-                'selected': '#1976D2',  # 选中状态颜色
-                'border': '#555555',    # 边框颜色
-            }
+            # 使用默认颜色方案，所有实例共用同一个只读映射
+            self.COLORS = DEFAULT_COLORS
+        
+        colors = self.COLORS
         
-        # 获取当前系统
-        system = platform.system()
+        # Treeview交替行颜色，在实际创建Treeview后通过tag_configure应用
+        self.tree_odd_row = colors['bg_light']
+        self.tree_even_row = colors.get('bg_alternate', colors['bg_dark'])
+        logger.debug("设置Treeview交替行颜色: 奇数行 %s, 偶数行 %s", self.tree_odd_row, self.tree_even_row)
+        
+        # 设置根窗口背景色
+        self.root.configure(background=colors['bg_dark'])
+        
+        # ttk样式属于Tcl解释器，解释器中已按相同颜色配置过时无需重复配置
+        style_key = repr(sorted(colors.items()))
+        try:
+            applied_key = self.root.getvar(STYLE_KEY_VAR)
+        except tk.TclError:
+            applied_key = None
+        if applied_key == style_key:
+            logger.debug("样式未变化，跳过样式配置")
+            return
         
         # 配置样式
         style = ttk.Style()
         
-        # 设置主题
-        if system == "Windows":
-            style.theme_use("vista")
-        elif system == "Darwin":  # macOS
-            style.theme_use("aqua")
-        else:  # Linux
-            style.theme_use("clam")
-            
-        # 配置Treeview样式（暗色）
-        style.configure("Treeview",
-            background=self.COLORS['bg_light'],
-            foreground=self.COLORS['fg'],
-            fieldbackground=self.COLORS['bg_light'],
-            borderwidth=1,
-            rowheight=24)  # 增加行高改善可读性
-        
-        # 配置Treeview标题样式
-        style.configure("Treeview.Heading",
-            background=self.COLORS['bg_accent'],
-            foreground=self.COLORS['fg'],
-            relief="flat",
-            font=('Arial', 10, 'bold'))  # 使用粗体改善可读性
-        style.map("Treeview.Heading",
-            background=[('active', self.COLORS['hover'])])
-            
-        # 配置Treeview选中项样式
-        style.map("Treeview",
-            background=[('selected', self.COLORS['selected'])],
-            foreground=[('selected', self.COLORS['fg'])])
-            
-        # 确保Treeview行有交替颜色以提高可读性
-        try:
-            # 尝试使用 _configure_treeview 方法
-            if hasattr(style, '_configure_treeview') and callable(getattr(style, '_configure_treeview')):
-                style._configure_treeview()  # 重新配置Treeview以应用上述更改
-                logger.debug("使用 _configure_treeview 方法配置Treeview样式")
-            else:
-                # 在较新的tkinter版本中，可以使用以下方法配置交替行颜色
-                style.configure("Treeview", 
-                    background=self.COLORS['bg_light'],
-                    foreground=self.COLORS['fg'],
-                    fieldbackground=self.COLORS['bg_light'])
-                
-                # 尝试设置交替行颜色（如果支持）
-                style.configure("Treeview", rowheight=24)
-                logger.debug("使用替代方法配置Treeview样式")
-        except Exception as e:
-            logger.warning(f"无法配置Treeview基本样式: {e}")
-            
-        # 尝试替代方案：交替行颜色的配置
-        try:
-            # 尝试通过tag_configure配置交替行颜色
-            # 这将在实际创建Treeview后应用
-            self.tree_odd_row = self.COLORS['bg_light']
-            self.tree_even_row = self.COLORS.get('bg_alternate', self.COLORS['bg_dark'])
-            logger.debug(f"设置Treeview交替行颜色: 奇数行 {self.tree_odd_row}, 偶数行 {self.tree_even_row}")
-        except Exception as e:
-            logger.warning(f"无法预配置Treeview交替行颜色: {e}")
-            
-        # 配置标签样式
-        style.configure("TLabel", 
-            background=self.COLORS['bg_dark'],
-            foreground=self.COLORS['fg'])
-            
-        # 配置按钮样式
-        style.configure("TButton", 
-            background=self.COLORS['bg_accent'],
-            foreground=self.COLORS['fg'])
-        style.map("TButton",
-            background=[('active', self.COLORS['active'])],
-            relief=[('pressed', 'sunken')])
-            
-        # 配置输入框样式
-        style.configure("TEntry", 
-            fieldbackground=self.COLORS['bg_light'],
-            foreground=self.COLORS['fg'],
-            insertcolor=self.COLORS['fg'])
-            
-        # 配置框架样式
-        style.configure("TFrame", 
-            background=self.COLORS['bg_dark'])
-            
-        # 配置标签框架样式
-        style.configure("TLabelframe", 
-            background=self.COLORS['bg_dark'],
-            foreground=self.COLORS['fg'])
-        style.configure("TLabelframe.Label", 
-            background=self.COLORS['bg_dark'],
-            foreground=self.COLORS['fg'])
-            
-        # 配置Notebook样式
-        style.configure("TNotebook", 
-            background=self.COLORS['bg_dark'],
-            tabmargins=[2, 5, 2, 0])
-        style.configure("TNotebook.Tab", 
-            background=self.COLORS['bg_accent'],
-            foreground=self.COLORS['fg'],
-            padding=[10, 2])
-        style.map("TNotebook.Tab",
-            background=[('selected', self.COLORS['active'])],
-            expand=[('selected', [1, 1, 1, 0])])
-            
-        # 配置进度条样式
-        style.configure("Horizontal.TProgressbar", 
-            background=self.COLORS['accent'])
-            
-        # 配置组合框样式
-        style.configure("TCombobox", 
-            fieldbackground=self.COLORS['bg_light'],
-            foreground=self.COLORS['fg'],
-            background=self.COLORS['bg_accent'])
-        style.map("TCombobox",
-            fieldbackground=[('readonly', self.COLORS['bg_light'])],
-            selectbackground=[('readonly', self.COLORS['selected'])],
-            selectforeground=[('readonly', self.COLORS['fg'])])
-            
-        # 创建暗色样式变体
-        style.configure("Dark.TFrame", background=self.COLORS['bg_dark'])
-        style.configure("Dark.TLabel", background=self.COLORS['bg_dark'], foreground=self.COLORS['fg'])
-        style.configure("Dark.TButton", background=self.COLORS['bg_accent'], foreground=self.COLORS['fg'])
-        style.configure("Dark.TEntry", fieldbackground=self.COLORS['bg_light'], foreground=self.COLORS['fg'])
-        style.configure("Dark.TLabelframe", background=self.COLORS['bg_dark'])
-        style.configure("Dark.TLabelframe.Label", background=self.COLORS['bg_dark'], foreground=self.COLORS['fg'])
-        style.configure("Dark.TNotebook", background=self.COLORS['bg_dark'])
-        style.configure("Dark.TNotebook.Tab", background=self.COLORS['bg_accent'], foreground=self.COLORS['fg'])
-        
-        # 服务管理面板特定样式
-        style.configure("Dark.Treeview", 
-            background=self.COLORS['bg_light'],
-            foreground=self.COLORS['fg'],
-            fieldbackground=self.COLORS['bg_light'])
-        style.configure("Dark.Treeview.Heading", 
-            background=self.COLORS['bg_accent'],
-            foreground=self.COLORS['fg'])
-        style.map("Dark.Treeview",
-            background=[('selected', self.COLORS['selected'])],
-            foreground=[('selected', self.COLORS['fg'])])
-        
-        # 复选框和单选按钮样式
-        style.configure("Dark.TCheckbutton", 
-            background=self.COLORS['bg_dark'],
-            foreground=self.COLORS['fg'])
-        style.map("Dark.TCheckbutton",
-            background=[('active', self.COLORS['bg_dark'])],
-            foreground=[('active', self.COLORS['fg'])])
-        
-        style.configure("Dark.TRadiobutton", 
-            background=self.COLORS['bg_dark'],
-            foreground=self.COLORS['fg'])
-        style.map("Dark.TRadiobutton",
-            background=[('active', self.COLORS['bg_dark'])],
-            foreground=[('active', self.COLORS['fg'])])
-        
-        # 下拉列表样式
-        style.configure("Dark.TCombobox", 
-            fieldbackground=self.COLORS['bg_light'],
-            foreground=self.COLORS['fg'],
-            background=self.COLORS['bg_accent'])
-        style.map("Dark.TCombobox",
-            fieldbackground=[('readonly', self.COLORS['bg_light'])],
-            selectbackground=[('readonly', self.COLORS['selected'])],
-            selectforeground=[('readonly', self.COLORS['fg'])])
+        # 设置当前系统对应的主题
+        style.theme_use(_TTK_THEME)
+        
+        # 常用的颜色组合
+        dark = {'background': colors['bg_dark'], 'foreground': colors['fg']}
+        accent = {'background': colors['bg_accent'], 'foreground': colors['fg']}
+        field = {'fieldbackground': colors['bg_light'], 'foreground': colors['fg']}
+        tree = {**field, 'background': colors['bg_light']}
+        combobox = {**field, 'background': colors['bg_accent']}
+        
+        # 各样式的配置，每个样式只配置一次
+        configs = {
+            # Treeview样式（暗色），增加行高改善可读性
+            "Treeview": {**tree, 'borderwidth': 1, 'rowheight': 24},
+            # Treeview标题样式，使用粗体改善可读性
+            "Treeview.Heading": {**accent, 'relief': "flat", 'font': ('Arial', 10, 'bold')},
+            "TLabel": dark,
+            "TButton": accent,
+            "TEntry": {**field, 'insertcolor': colors['fg']},
+            "TFrame": {'background': colors['bg_dark']},
+            "TLabelframe": dark,
+            "TLabelframe.Label": dark,
+            "TNotebook": {'background': colors['bg_dark'], 'tabmargins': [2, 5, 2, 0]},
+            "TNotebook.Tab": {**accent, 'padding': [10, 2]},
+            "Horizontal.TProgressbar": {'background': colors['accent']},
+            "TCombobox": combobox,
+            # Dark.* 样式变体（Dark.TFrame、Dark.Treeview 等）按名称继承上面的基础样式，
+            # 只需配置没有对应基础样式的复选框和单选按钮
+            "Dark.TCheckbutton": dark,
+            "Dark.TRadiobutton": dark,
+        }
         
-        # 设置根窗口背景色
-        self.root.configure(background=self.COLORS['bg_dark'])
-    
-    def _get_alternate_color(self, base_color: str) -> str:
-        """
-        根据基础颜色生成交替行颜色
+        # 各样式的状态映射
+        tree_selected = {
+            'background': [('selected', colors['selected'])],
+            'foreground': [('selected', colors['fg'])],
+        }
+        dark_active = {
+            'background': [('active', colors['bg_dark'])],
+            'foreground': [('active', colors['fg'])],
+        }
+        combobox_readonly = {
+            'fieldbackground': [('readonly', colors['bg_light'])],
+            'selectbackground': [('readonly', colors['selected'])],
+            'selectforeground': [('readonly', colors['fg'])],
+        }
+        maps = {
+            "Treeview.Heading": {'background': [('active', colors['hover'])]},
+            "Treeview": tree_selected,
+            "TButton": {'background': [('active', colors['active'])], 'relief': [('pressed', 'sunken')]},
+            "TNotebook.Tab": {'background': [('selected', colors['active'])], 'expand': [('selected', [1, 1, 1, 0])]},
+            "TCombobox": combobox_readonly,
+            "Dark.TCheckbutton": dark_active,
+            "Dark.TRadiobutton": dark_active,
+        }
         
-        Args:
-            base_color: 基础颜色，格式为#RRGGBB
-            
-        Returns:
-            交替行颜色，格式为#RRGGBB
-        """
-        try:
-            # 将颜色转换为RGB值
-            r = int(base_color[1:3], 16)
-            g = int(base_color[3:5], 16)
-            b = int(base_color[5:7], 16)
-            
-            # 判断是否是暗色
-            is_dark = (r + g + b) < 384  # 128 * 3
-            
-            # 对暗色，稍微变亮；对亮色，稍微变暗
-            if is_dark:
-                # 变亮10%
-                r = min(255, r + 25)
-                g = min(255, g + 25)
-                b = min(255, b + 25)
-            else:
-                # 变暗10%
-                r = max(0, r - 25)
-                g = max(0, g - 25)
-                b = max(0, b - 25)
-            
-            # 转换回十六进制颜色
-            return f"#{r:02x}{g:02x}{b:02x}"
-        except Exception as e:
-            logger.warning(f"生成交替行颜色失败: {e}")
-            # 默认返回略微不同的颜色
-            if base_color.startswith('#'):
-                # 简单地修改颜色，使其稍有不同
-                if base_color[1] < 'c':
-                    return '#' + chr(ord(base_color[1]) + 1) + base_color[2:]
-                else:
-                    return '#' + chr(ord(base_color[1]) - 1) + base_color[2:]
-            return "#333333"  # 默认暗色
+        for name, options in configs.items():
+            style.configure(name, **options)
+        for name, options in maps.items():
+            style.map(name, **options)
+        
+        # 非ttk控件通过选项数据库取得颜色，创建时即生效，无需逐个配置
+        self.root.option_add("*Background", colors['bg_dark'])
+        self.root.option_add("*Foreground", colors['fg'])
+        self.root.setvar(STYLE_KEY_VAR, style_key)
     
     def _create_ui(self):
-        """创建主用户界面"""
-        # 在创建UI之前设置样式
-        self._setup_styles()
+        """创建主用户界面的基本布局
         
+        只同步创建框架、工具栏、文件区域和状态栏，分类区域和服务管理面板
+        先放置空容器，由 _finish_ui 在窗口首次绘制后填充。
+        """
         # 创建主框架
         self.main_frame = ttk.Frame(self.root, style="Dark.TFrame")
         self.main_frame.pack(fill=tk.BOTH, expand=True)
         
-        # 设置根窗口背景
-        self.root.configure(background=self.COLORS['bg_dark'])
-        
-        # 创建菜单栏
-        self._create_menus()
-        
         # 创建工具栏
         self._create_toolbar()
         
@@ -562,75 +558,91 @@ class AudioTranslatorGUI:
         self.file_area = self._create_file_area(self.file_tab)
         self.file_area.grid(row=0, column=0, sticky='nsew', padx=(0, 5))
         
-        # 创建分类相关组件
-        self.category_area = self._create_category_area(self.file_tab)
+        # 分类区域占位，稍后由 _finish_ui 填充
+        self.category_area = ttk.Frame(self.file_tab)
         self.category_area.grid(row=0, column=1, sticky='nsew')
         
         # 创建服务管理标签页
         self.service_tab = ttk.Frame(self.notebook, style="Dark.TFrame")
         self.notebook.add(self.service_tab, text="服务管理")
         
-        # 获取service_manager_service实例
-        service_manager = self.service_factory.get_service("service_manager_service")
-        
-        # 创建ServiceManagerPanel并添加到服务管理标签页
-        if service_manager:
-            self.service_manager_panel = ServiceManagerPanel(self.service_tab, service_manager)
-            self.service_manager_panel.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
-        else:
-            # 如果服务管理器不可用，显示错误消息
-            ttk.Label(
-                self.service_tab, 
-                text="服务管理功能不可用，请检查配置", 
-                style="Dark.TLabel"
-            ).pack(expand=True, pady=50)
+        # 标签页路径到标题的映射，切换标签页时无需再向Tk查询标题
+        self._tab_texts = {str(self.file_tab): "文件管理", str(self.service_tab): "服务管理"}
         
         # 创建状态栏
         self._create_status_bar()
         
         # 关联选项卡切换事件
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+    
+    def _finish_ui(self):
+        """在窗口首次绘制后创建较重的界面部分"""
+        # 确保基本布局已经绘制出来
+        self.root.update_idletasks()
+        
+        # 创建分类相关组件
+        self._create_category_area(self.category_area).pack(fill=tk.BOTH, expand=True)
         
-        # 现在填充分类树
-        self._populate_category_tree()
+        # 服务管理标签页的内容在首次切换到该标签页时才创建
         
-        # 更新翻译策略信息
-        self._update_strategy_info()
+        # 分类树和翻译策略信息在界面显示后再加载，先显示占位文本
+        self.category_path_var.set("加载中…")
+        self.root.after_idle(self._load_initial_category_tree)
+        self.root.after(50, self._update_strategy_info)
         
         # 确保所有控件都应用正确的样式
         self._apply_theme_to_all_widgets()
         
-        # 绑定事件
-        self._bind_events()
+        # 创建菜单
+        self._create_menus()
         
     def _apply_theme_to_all_widgets(self):
         """确保所有控件都应用了正确的主题和样式"""
         try:
             # 如果启用了主题服务，对所有控件应用主题
-            if hasattr(self, 'theme_service') and self.theme_service:
+            # 非ttk控件的颜色已在 _setup_styles 中写入选项数据库
+            if self.theme_service:
                 self.theme_service.setup_window_theme(self.root)
             
-            # 递归应用样式到所有子控件
-            def apply_style_to_widget(widget):
-                # 尝试设置背景和前景色
-                try:
-                    if isinstance(widget, tk.Widget) and not isinstance(widget, ttk.Widget):
-                        widget.configure(bg=self.COLORS['bg_dark'])
-                        if hasattr(widget, 'cget') and widget.cget('foreground') != '':
-                            widget.configure(fg=self.COLORS['fg'])
-                except Exception as e:
-                    logger.debug(f"无法设置控件样式: {e}")
-                
-                # 递归应用到所有子控件
-                for child in widget.winfo_children():
-                    apply_style_to_widget(child)
-            
-            # 从根窗口开始应用样式
-            apply_style_to_widget(self.root)
-            
             logger.debug("已应用主题样式到所有控件")
         except Exception as e:
-            logger.error(f"应用主题样式失败: {e}")
+            logger.error("应用主题样式失败: %s", e)
+    
+    def _build_service_panel(self):
+        """创建服务管理标签页的内容"""
+        if self.service_manager:
+            ServiceManagerPanel = self._load_dialog('service_manager_panel', '.panels.service_manager_panel', 'ServiceManagerPanel')
+            self.service_manager_panel = ServiceManagerPanel(self.service_tab, self.service_manager)
+            self.service_manager_panel.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        else:
+            # 如果服务管理器不可用，显示错误消息
+            ttk.Label(
+                self.service_tab, 
+                text="服务管理功能不可用，请检查配置", 
+                style="Dark.TLabel"
+            ).pack(expand=True, pady=50)
+    
+    def _make_button(self, parent, text: str, command: Callable[[], None],
+                     tooltip: Optional[str] = None, padx: Any = 5, **options) -> ttk.Button:
+        """
+        创建按钮并从左到右排列
+        
+        Args:
+            parent: 父级容器
+            text: 按钮文本
+            command: 点击按钮时调用的函数
+            tooltip: 悬浮提示文本，为None时不添加提示
+            padx: 水平间距
+            options: 传给ttk.Button的其他选项
+            
+        Returns:
+            创建的按钮
+        """
+        button = ttk.Button(parent, text=text, command=command, **options)
+        button.pack(side=tk.LEFT, padx=padx)
+        if tooltip:
+            create_tooltip(button, tooltip)
+        return button
     
     def _create_toolbar(self):
         """创建工具栏"""
@@ -642,27 +654,28 @@ class AudioTranslatorGUI:
         button_frame = ttk.Frame(toolbar_frame, style="Dark.TFrame")
         button_frame.pack(side=tk.LEFT)
         
-        # 添加按钮
-        ttk.Button(button_frame, text="打开文件夹", command=self._open_directory).pack(side=tk.LEFT, padx=(0, 5))
-        ttk.Button(button_frame, text="刷新", command=self._refresh_current_directory).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="分类", command=self._categorize_selected_files).pack(side=tk.LEFT, padx=5)
-        ttk.Button(button_frame, text="自动分类", command=self._auto_categorize_files).pack(side=tk.LEFT, padx=5)
-        
-        # 添加翻译策略按钮
-        self.strategy_button = ttk.Button(button_frame, text="翻译策略", command=self._on_open_translation_strategy_dialog)
-        self.strategy_button.pack(side=tk.LEFT, padx=5)
-        create_tooltip(self.strategy_button, "配置和管理翻译策略 (Ctrl+T)")
-        
-        # 添加命名规则按钮
-        self.naming_rule_button = ttk.Button(button_frame, text="命名规则", command=self._on_open_naming_rule_dialog)
-        self.naming_rule_button.pack(side=tk.LEFT, padx=5)
-        create_tooltip(self.naming_rule_button, "配置和管理命名规则 (Ctrl+N)")
+        # 工具栏按钮：(文本, 回调, 提示, 保存按钮的属性名)
+        buttons = (
+            ("打开文件夹", self._open_directory, None, None),
+            ("刷新", self._refresh_current_directory, None, None),
+            ("分类", self._categorize_selected_files, None, None),
+            ("自动分类", self._auto_categorize_files, None, None),
+            ("翻译策略", self._on_open_translation_strategy_dialog,
+             "配置和管理翻译策略 (Ctrl+T)", "strategy_button"),
+            ("命名规则", self._on_open_naming_rule_dialog,
+             "配置和管理命名规则 (Ctrl+N)", "naming_rule_button"),
+        )
+        for i, (text, command, tooltip, attr) in enumerate(buttons):
+            button = self._make_button(button_frame, text, command, tooltip=tooltip,
+                                       padx=(0, 5) if i == 0 else 5)
+            if attr:
+                setattr(self, attr, button)
         
         # 添加搜索标签
         ttk.Label(toolbar_frame, text="搜索:", style="Dark.TLabel").pack(side=tk.LEFT, padx=(15, 5))
         
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", self._on_search_change)
+        self.search_var.trace_add("write", self._on_search_change)
         self.search_entry = ttk.Entry(toolbar_frame, textvariable=self.search_var, width=15, style="Dark.TEntry")
         self.search_entry.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -716,24 +729,24 @@ class AudioTranslatorGUI:
         title_frame = ttk.Frame(category_area_frame)
         title_frame.pack(fill=tk.X, pady=(0, 5))
         
-        title_label = ttk.Label(title_frame, text="分类管理", font=("Helvetica", 10, "bold"))
-        title_label.pack(side=tk.LEFT, padx=5)
+        self.category_title_label = ttk.Label(title_frame, text="分类管理", font=("Helvetica", 10, "bold"))
+        self.category_title_label.pack(side=tk.LEFT, padx=5)
         
         # 创建操作按钮
         actions_frame = ttk.Frame(category_area_frame)
         actions_frame.pack(fill=tk.X, pady=5)
         
         # 添加分类按钮
-        self.add_category_btn = ttk.Button(actions_frame, text="添加分类", width=12, 
-                                           command=self._on_add_category)
-        self.add_category_btn.pack(side=tk.LEFT, padx=5)
-        create_tooltip(self.add_category_btn, "添加新的文件分类")
+        self.add_category_btn = self._make_button(
+            actions_frame, "添加分类", self._on_add_category,
+            tooltip="添加新的文件分类", width=12
+        )
         
-        # 删除分类按钮
-        self.del_category_btn = ttk.Button(actions_frame, text="删除分类", width=12,
-                                           command=self._on_delete_category)
-        self.del_category_btn.pack(side=tk.LEFT, padx=5)
-        create_tooltip(self.del_category_btn, "删除选定的分类")
+        # 删除分类按钮，选中分类后才可用
+        self.del_category_btn = self._make_button(
+            actions_frame, "删除分类", self._on_delete_category,
+            tooltip="删除选定的分类", width=12, state=tk.DISABLED
+        )
         
         # 分类树区域
         tree_frame = ttk.Frame(category_area_frame)
@@ -758,20 +771,32 @@ class AudioTranslatorGUI:
         self.category_tree.heading("count", text="数量", anchor=tk.CENTER)
         
         # 应用交替行颜色，设置标签用于交替行
-        if hasattr(self, 'tree_odd_row') and hasattr(self, 'tree_even_row'):
+        if self.tree_odd_row and self.tree_even_row:
             try:
                 # 配置标签用于交替行颜色
                 self.category_tree.tag_configure('odd', background=self.tree_odd_row)
                 self.category_tree.tag_configure('even', background=self.tree_even_row)
                 logger.debug("已应用Treeview交替行颜色配置")
             except Exception as e:
-                logger.warning(f"应用交替行颜色失败: {e}")
+                logger.warning("应用交替行颜色失败: %s", e)
         
         # 绑定事件
         self.category_tree.bind("<<TreeviewSelect>>", self._on_category_selected)
         self.category_tree.bind("<Double-1>", self._on_category_double_click)
+        self.category_tree.bind("<<TreeviewOpen>>", self._on_category_tree_open)
         self.category_tree.bind("<Button-3>", self._show_category_context_menu)
         
+        # 分类右键菜单只创建一次，弹出时通过 _ctx_item 确定操作的分类
+        self._ctx_item: Optional[str] = None
+        self._category_context_menu = tk.Menu(self.category_tree, tearoff=0)
+        self._category_context_menu.add_command(label="添加子分类",
+                                                command=lambda: self._on_add_subcategory(self._ctx_item))
+        self._category_context_menu.add_command(label="重命名分类",
+                                                command=lambda: self._on_rename_category(self._ctx_item))
+        self._category_context_menu.add_separator()
+        self._category_context_menu.add_command(label="删除分类",
+                                                command=lambda: self._on_delete_category(self._ctx_item))
+        
         # 创建分类信息区域
         info_frame = ttk.LabelFrame(category_area_frame, text="分类信息")
         info_frame.pack(fill=tk.X, pady=5, padx=5)
@@ -872,39 +897,116 @@ class AudioTranslatorGUI:
         
         使用FileManagerPanel获取选中的文件
         """
-        if not hasattr(self, 'file_manager_panel'):
-            messagebox.showinfo("提示", "请先加载文件")
+        if self.file_manager_panel is None:
+            self._notify('info', "请先加载文件")
+            return
+            
+        if self._move_future is not None:
+            self._notify('info', "正在分类文件，请稍候")
             return
             
         selected_files = self.file_manager_panel.get_selected_files()
         if not selected_files:
-            messagebox.showinfo("提示", "请选择要分类的文件")
+            self._notify('info', "请选择要分类的文件")
+            return
+        
+        # 文件路径 -> 文件ID，同时去重并过滤已不存在的文件
+        id_by_path = {}
+        stale = False
+        for file_id in selected_files:
+            file_path = self.file_manager.get_file_property(file_id, "path")
+            if not file_path or file_path in id_by_path:
+                continue
+            if os.path.exists(file_path):
+                id_by_path[file_path] = file_id
+            else:
+                stale = True
+        
+        # 有文件已被外部删除或移动时，重新加载文件列表以移除失效的行
+        if stale:
+            self._schedule_refresh('file_tree')
+        if not id_by_path:
+            self._notify('warning', "选中的文件已不存在")
             return
             
-        # 创建分类选择对话框
-        dialog = CategorySelectionDialog(
-            self.root, 
-            self.category_manager, 
-            selected_files
+        # 显示分类选择对话框
+        result = self.category_manager.show_category_dialog(list(id_by_path))
+        if not result:
+            return
+        
+        category_id = result['category_id']
+        category_name = self.category_manager.get_category_display_name(category_id)
+        base_path = str(self.file_manager.current_directory)
+        
+        # 在后台线程中移动文件，界面保持响应
+        self.status_message.set(f"正在将 {len(id_by_path)} 个文件分类为 {category_name}...")
+        self.root.config(cursor="watch")
+        self._move_future = self._io_executor.submit(
+            self.category_manager.move_files_to_category,
+            list(id_by_path), category_id, base_path
         )
+        self.root.after(MOVE_POLL_MS, self._poll_move_files, category_id, category_name)
+    
+    def _poll_move_files(self, category_id: str, category_name: str):
+        """
+        等待后台文件移动完成
         
-        # 如果用户确认分类，更新文件状态
-        if dialog.result:
-            category_id = dialog.result
-            category_name = self.category_manager.get_category_name(category_id)
-            
-            # 更新文件状态
-            count = self.file_manager.batch_update_status(selected_files, f"已分类: {category_name}")
-            
-            # 更新UI
-            if hasattr(self, 'file_manager_panel'):
-                self.file_manager_panel._refresh_files()
-                
-            # 更新状态栏
-            self.status_message.set(f"已将 {count} 个文件分类为 {category_name}")
+        Args:
+            category_id: 分类ID
+            category_name: 分类显示名称
+        """
+        future = self._move_future
+        if not future.done():
+            self.root.after(MOVE_POLL_MS, self._poll_move_files, category_id, category_name)
+            return
+        
+        self._move_future = None
+        self.root.config(cursor="")
+        
+        try:
+            moved_files = future.result()
+        except Exception as e:
+            logger.error("分类文件失败: %s", e)
+            self.status_message.set("分类文件失败")
+            messagebox.showerror("错误", f"分类文件失败: {e}")
+            return
+        
+        self._on_move_done(category_id, category_name, moved_files)
+    
+    def _on_move_done(self, category_id: str, category_name: str,
+                      moved_files: List[Tuple[str, str]]):
+        """
+        文件移动完成后更新文件状态，并重新加载文件列表
+        
+        文件已被移动到分类目录，FileManager 和文件树中记录的仍是旧路径，
+        先就地更新状态给出即时反馈，再合并刷新文件树以同步路径。
+        
+        Args:
+            category_id: 分类ID
+            category_name: 分类显示名称
+            moved_files: 成功移动的 (源路径, 目标路径) 列表
+        """
+        status = f"已分类: {category_name}"
+        
+        # 按源路径更新文件状态，同时得到受影响的文件ID
+        moved_ids = self.file_manager.batch_update_status_from_paths(
+            (source for source, _ in moved_files), status
+        )
+        count = len(moved_ids)
+        
+        # 只更新受影响的行
+        if self.file_manager_panel is not None:
+            self.file_manager_panel.update_files_status(moved_ids, status)
+        
+        # 已移动文件的旧路径失效，重新加载文件列表
+        if moved_files:
+            self._schedule_refresh('file_tree')
             
-            # 记录日志
-            logger.info(f"已将 {count} 个文件分类为 {category_name} (ID: {category_id})")
+        # 更新状态栏
+        self._notify('info', f"已将 {count} 个文件分类为 {category_name}")
+        
+        # 记录日志
+        logger.info("已将 %d 个文件分类为 %s (ID: %s)", count, category_name, category_id)
     
     def _auto_categorize_files(self):
         """
@@ -912,47 +1014,63 @@ class AudioTranslatorGUI:
         
         使用FileManagerPanel获取选中的文件
         """
-        if not hasattr(self, 'file_manager_panel'):
-            messagebox.showinfo("提示", "请先加载文件")
+        if self.file_manager_panel is None:
+            self._notify('info', "请先加载文件")
             return
             
-        selected_files = self.file_manager_panel.get_selected_files()
-        if not selected_files:
-            messagebox.showinfo("提示", "请选择要自动分类的文件")
+        selected_paths = self.file_manager_panel.get_selected_file_paths()
+        if not selected_paths:
+            self._notify('info', "请选择要自动分类的文件")
+            return
+        
+        # 与上次成功分类的选择相同且间隔很短时，视为重复点击
+        selection = frozenset(selected_paths)
+        if (selection == self._last_auto_selection
+                and time.monotonic() - self._last_auto_time < AUTO_CATEGORIZE_REPEAT_WINDOW):
+            self._notify('info', "与上次选择相同，已跳过重复分类")
+            return
+        
+        # 去重并过滤已不存在的文件，保持原有顺序
+        existing_paths = [path for path in dict.fromkeys(selected_paths) if os.path.exists(path)]
+        if len(existing_paths) != len(selected_paths):
+            self._schedule_refresh('file_tree')
+        if not existing_paths:
+            self._notify('warning', "选中的文件已不存在")
             return
+        selected_paths = existing_paths
             
-        # 创建自动分类对话框
-        dialog = AutoCategorizeDialog(
-            self.root, 
-            self.category_manager,
-            self.file_manager,
-            selected_files
+        # 显示自动分类对话框，返回成功分类的文件列表
+        categorized_files = self.category_manager.start_auto_categorize(
+            selected_paths,
+            str(self.file_manager.current_directory)
         )
         
         # 如果用户确认分类，更新文件状态并刷新UI
-        if dialog.categorized_files:
-            # 更新UI
-            if hasattr(self, 'file_manager_panel'):
-                self.file_manager_panel._refresh_files()
+        if categorized_files:
+            self._last_auto_selection = selection
+            self._last_auto_time = time.monotonic()
+            
+            # 文件已被移动，文件树和分类树在同一次刷新中更新
+            self._schedule_refresh('file_tree', 'category_tree')
                 
             # 更新状态栏
-            count = len(dialog.categorized_files)
-            self.status_message.set(f"已自动分类 {count} 个文件")
+            count = len(categorized_files)
+            self._notify('info', f"已自动分类 {count} 个文件")
             
             # 记录日志
-            logger.info(f"已自动分类 {count} 个文件")
+            logger.info("已自动分类 %d 个文件", count)
     
     def _on_search_change(self, *args):
         """当搜索文本变化时过滤文件列表"""
-        # 将由FileManagerPanel处理
-        if hasattr(self, 'file_manager_panel'):
-            self.file_manager_panel._on_search_change(*args)
+        # 同步到FileManagerPanel的搜索变量，由面板负责过滤
+        if self.file_manager_panel is not None:
+            self.file_manager_panel.search_var.set(self.search_var.get())
         
     def _on_filter_change(self, *args):
         """当过滤条件变化时过滤文件列表"""
-        # 将由FileManagerPanel处理
-        if hasattr(self, 'file_manager_panel'):
-            self.file_manager_panel._on_filter_change(*args)
+        # 同步到FileManagerPanel的过滤变量，由面板负责过滤
+        if self.file_manager_panel is not None:
+            self.file_manager_panel.filter_var.set(self.status_filter_var.get())
         
     def _update_status_bar(self):
         """更新状态栏"""
@@ -968,9 +1086,7 @@ class AudioTranslatorGUI:
         status_bar = ttk.Frame(self.root, relief=tk.SUNKEN, style="StatusBar.TFrame")
         status_bar.pack(side=tk.BOTTOM, fill=tk.X)
         
-        # 创建状态消息标签
-        self.status_message = tk.StringVar()
-        self.status_message.set("就绪")
+        # 创建状态消息标签，复用初始化时创建的状态变量
         status_label = ttk.Label(
             status_bar, 
             textvariable=self.status_message, 
@@ -990,15 +1106,13 @@ class AudioTranslatorGUI:
         )
         strategy_label.pack(side=tk.RIGHT, padx=10)
         
-        # 初始化翻译策略信息
-        self._update_strategy_info()
+        # 翻译策略信息在窗口显示后再获取，见 _finish_ui
         
         # 创建版本信息标签
         # 尝试从配置服务获取版本号，如果不可用则使用默认值
         app_version = "1.0.0"
-        config_service = self.service_factory.get_service('config_service')
-        if config_service:
-            app_version = config_service.get('app_version', app_version)
+        if self.config_service:
+            app_version = self.config_service.get('app_version', app_version)
         
         version_label = ttk.Label(
             status_bar, 
@@ -1011,14 +1125,76 @@ class AudioTranslatorGUI:
         # 初始更新状态栏
         self._update_status_bar()
 
-    def _on_close(self):
+    def _notify(self, level: str, message: str, modal: bool = False):
+        """
+        向用户显示通知
+        
+        错误和显式要求的通知使用模态对话框，其余通知只显示在状态栏中，
+        并在一段时间后自动恢复为"就绪"。
+        
+        Args:
+            level: 通知级别，'info'、'warning' 或 'error'
+            message: 通知内容
+            modal: 是否使用模态对话框
+        """
+        if modal or level == 'error':
+            show = {'error': messagebox.showerror, 'warning': messagebox.showwarning}.get(level, messagebox.showinfo)
+            title = {'error': "错误", 'warning': "警告"}.get(level, "提示")
+            show(title, message, parent=self.root)
+            return
+        
+        logger.log(logging.WARNING if level == 'warning' else logging.DEBUG, message)
+        self.status_message.set(message)
+        
+        # 重新安排自动清除，只清除仍在显示的这条通知
+        if self._notify_clear_id is not None:
+            self.root.after_cancel(self._notify_clear_id)
+        self._notify_clear_id = self.root.after(NOTIFY_CLEAR_MS, self._clear_notification, message)
+    
+    def _clear_notification(self, message: str):
+        """
+        清除状态栏通知
+        
+        Args:
+            message: 要清除的通知内容
+        """
+        self._notify_clear_id = None
+        if self.status_message.get() == message:
+            self.status_message.set("就绪")
+    
+    def _on_close(self, event=None):
         """处理窗口关闭事件"""
-        # 在这里可以添加关闭前的清理工作
+        if self._closing:
+            return
+        self._closing = True
         logger.info("应用程序正在关闭")
         
-        # 关闭服务
-        if hasattr(self, 'service_factory') and self.service_factory:
-            self.service_factory.shutdown_all_services()
+        # 先隐藏窗口，服务关闭可能涉及网络或文件操作，在后台线程中进行
+        self.root.withdraw()
+        shutdown_future = None
+        if self.service_factory:
+            shutdown_future = self._io_executor.submit(self.service_factory.shutdown_all_services)
+        
+        # 停止接收新的后台文件操作和分类操作
+        self._io_executor.shutdown(wait=False)
+        self._category_executor.shutdown(wait=False)
+        
+        self._wait_for_shutdown(shutdown_future, time.monotonic() + SHUTDOWN_TIMEOUT)
+    
+    def _wait_for_shutdown(self, future: Optional[Future], deadline: float):
+        """
+        等待服务关闭完成后销毁窗口
+        
+        Args:
+            future: 关闭服务的任务，没有服务需要关闭时为None
+            deadline: 最晚销毁窗口的时间（time.monotonic）
+        """
+        if future is not None and not future.done() and time.monotonic() < deadline:
+            self.root.after(SHUTDOWN_POLL_MS, self._wait_for_shutdown, future, deadline)
+            return
+        
+        if future is not None and future.done() and future.exception() is not None:
+            logger.error("关闭服务时发生错误: %s", future.exception())
         
         # 关闭窗口
         self.root.destroy()
@@ -1026,121 +1202,273 @@ class AudioTranslatorGUI:
     def _bind_events(self):
         """绑定事件处理函数"""
         # 绑定窗口大小变化事件
-        self.root.bind("<Configure>", self._on_window_resize)
+        # 子控件的 <Configure> 事件也会传到根窗口，在Tcl层先过滤掉，
+        # 只有根窗口自身的事件才会调用Python回调
+        resize_command = self.root.register(self._on_window_resize)
+        root_path = str(self.root)
+        self.root.tk.call(
+            "bind", root_path, "<Configure>",
+            f'if {{"%W" eq "{root_path}"}} {{{resize_command}}}'
+        )
         
         # 绑定键盘快捷键
-        self.root.bind("<Control-o>", lambda e: self._open_directory())
-        self.root.bind("<Control-r>", lambda e: self._refresh_current_directory())
-        self.root.bind("<Control-q>", lambda e: self._on_close())
-        self.root.bind("<Control-p>", lambda e: self._on_preferences())
-        self.root.bind("<Control-t>", lambda e: self._on_open_translation_strategy_dialog())
-        self.root.bind("<Control-n>", lambda e: self._on_open_naming_rule_dialog())
+        self.root.bind("<Control-o>", self._open_directory)
+        self.root.bind("<Control-r>", self._refresh_current_directory)
+        self.root.bind("<Control-q>", self._on_close)
+        self.root.bind("<Control-p>", self._on_preferences)
+        self.root.bind("<Control-t>", self._on_open_translation_strategy_dialog)
+        self.root.bind("<Control-n>", self._on_open_naming_rule_dialog)
 
-    def _on_window_resize(self, event):
-        """处理窗口大小变化事件"""
-        # 只处理来自根窗口的事件
-        if event.widget == self.root:
-            # 可以在这里添加窗口大小变化的处理逻辑
-            pass
+    def _on_window_resize(self):
+        """处理根窗口大小变化事件，拖动过程中的多次事件合并为一次处理"""
+        if self._resize_after_id is not None:
+            self.root.after_cancel(self._resize_after_id)
+        self._resize_after_id = self.root.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+    
+    def _apply_resize(self):
+        """在窗口大小停止变化后处理"""
+        self._resize_after_id = None
+        size = (self.root.winfo_width(), self.root.winfo_height())
+        if size == self._window_size:
+            return
+        self._window_size = size
+        # 可以在这里添加窗口大小变化的处理逻辑
 
     def _create_menus(self):
-        """创建菜单栏"""
+        """创建菜单栏，各菜单的菜单项在首次打开时才添加"""
         self.menu_bar = tk.Menu(self.root)
         
-        # 文件菜单
-        self.file_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.file_menu.add_command(label="打开文件夹", command=self._open_directory)
-        self.file_menu.add_command(label="刷新", command=self._refresh_current_directory)
-        self.file_menu.add_separator()
-        self.file_menu.add_command(label="退出", command=self._on_close)
-        
-        # 编辑菜单
-        self.edit_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.edit_menu.add_command(label="首选项", command=self._on_preferences)
-        
-        # 工具菜单
-        self.tools_menu = tk.Menu(self.menu_bar, tearoff=0)
-        self.tools_menu.add_command(label="模型管理", command=self._on_model_manager)
-        self.tools_menu.add_command(label="翻译策略", command=self._on_open_translation_strategy_dialog)
-        self.tools_menu.add_command(label="命名规则", command=self._on_open_naming_rule_dialog)
+        # 菜单项列表，None 表示分隔线
+        menus = (
+            ("文件", "file_menu", [
+                ("打开文件夹", self._open_directory),
+                ("刷新", self._refresh_current_directory),
+                None,
+                ("退出", self._on_close),
+            ]),
+            ("编辑", "edit_menu", [
+                ("首选项", self._on_preferences),
+            ]),
+            ("工具", "tools_menu", [
+                ("模型管理", self._on_model_manager),
+                ("翻译策略", self._on_open_translation_strategy_dialog),
+                ("命名规则", self._on_open_naming_rule_dialog),
+            ]),
+        )
         
         # 将菜单添加到菜单栏
-        self.menu_bar.add_cascade(label="文件", menu=self.file_menu)
-        self.menu_bar.add_cascade(label="编辑", menu=self.edit_menu)
-        self.menu_bar.add_cascade(label="工具", menu=self.tools_menu)
+        for label, attr_name, items in menus:
+            menu = tk.Menu(self.menu_bar, tearoff=0)
+            menu.configure(postcommand=functools.partial(self._fill_menu, menu, items))
+            setattr(self, attr_name, menu)
+            self.menu_bar.add_cascade(label=label, menu=menu)
         
         # 设置菜单栏
         self.root.config(menu=self.menu_bar)
+    
+    def _fill_menu(self, menu: tk.Menu, items: List[Optional[Tuple[str, Callable[[], None]]]]):
+        """
+        首次打开菜单时添加菜单项
+        
+        Args:
+            menu: 要填充的菜单
+            items: 菜单项列表，每项为 (标签, 命令)，None 表示分隔线
+        """
+        # 只需填充一次
+        menu.configure(postcommand="")
+        for item in items:
+            if item is None:
+                menu.add_separator()
+            else:
+                label, command = item
+                menu.add_command(label=label, command=command)
 
+    def _load_dialog(self, key: str, module_name: str, class_name: str) -> Any:
+        """
+        按需导入对话框或面板，导入结果缓存在实例上
+        
+        Args:
+            key: 缓存键
+            module_name: 相对于gui包的模块名
+            class_name: 类名或创建函数名
+            
+        Returns:
+            对话框类、面板类或创建函数
+        """
+        dialog_class = self._dialog_classes.get(key)
+        if dialog_class is None:
+            module = importlib.import_module(module_name, package=__package__)
+            dialog_class = getattr(module, class_name)
+            self._dialog_classes[key] = dialog_class
+        return dialog_class
+    
     def _on_model_manager(self):
         """打开模型管理对话框"""
         try:
-            from .dialogs.model_manager_dialog import ModelManagerDialog
-            
-            # 获取服务管理器和配置服务
-            service_manager = self.service_factory.get_service("service_manager_service")
-            config_service = self.service_factory.get_service("config_service")
+            ModelManagerDialog = self._load_dialog('model_manager', '.dialogs.model_manager_dialog', 'ModelManagerDialog')
             
-            if not service_manager or not config_service:
+            if not self.service_manager or not self.config_service:
                 messagebox.showerror("错误", "无法获取服务管理器或配置服务")
                 return
             
             # 创建并显示模型管理对话框
-            dialog = ModelManagerDialog(self.root, service_manager, config_service)
-            self.root.wait_window(dialog)
+            dialog = ModelManagerDialog(self.root, self.service_manager, self.config_service)
             
-            # 对话框关闭后，可能需要刷新UI或其他操作
-            self._refresh_ui()
+            # 对话框关闭后刷新UI，不阻塞主事件循环
+            self._bind_close_callback(dialog, self._on_model_manager_closed)
         except Exception as e:
-            logger.error(f"打开模型管理对话框时发生错误: {e}")
+            logger.error("打开模型管理对话框时发生错误: %s", e)
             messagebox.showerror("错误", f"无法打开模型管理对话框: {e}")
             
+    def _on_model_manager_closed(self):
+        """模型管理对话框关闭后的处理"""
+        self._categories_cache = None
+        self._schedule_refresh('ui')
+    
+    def _bind_close_callback(self, dialog: tk.Toplevel, on_close: Callable[[], None]):
+        """
+        在对话框销毁后调用回调函数
+        
+        替代 wait_window，对话框打开期间主事件循环照常处理其他事件。
+        
+        Args:
+            dialog: 对话框窗口
+            on_close: 对话框关闭后调用的函数
+        """
+        def _on_destroy(event):
+            # 子控件销毁时也会收到 <Destroy> 事件，只响应对话框本身
+            if event.widget is dialog:
+                self.root.after_idle(on_close)
+        
+        dialog.bind("<Destroy>", _on_destroy, add="+")
+    
+    def _show_cached_dialog(self, key: str, service: Any,
+                            create: Callable[[tk.Tk, Any], tk.Toplevel],
+                            on_close: Optional[Callable[[], None]] = None) -> tk.Toplevel:
+        """
+        显示可复用的模态对话框
+        
+        对话框只在首次打开或服务实例变化时创建，关闭时隐藏，
+        再次打开时直接显示已创建的对话框。
+        
+        Args:
+            key: 缓存键
+            service: 对话框使用的服务
+            create: 创建对话框的函数，参数为父窗口和服务
+            on_close: 对话框关闭后调用的函数
+            
+        Returns:
+            对话框窗口
+        """
+        cached = self._cached_dialogs.get(key)
+        if cached is not None and cached[1].winfo_exists():
+            cached_service, dialog = cached
+            if cached_service is service:
+                dialog.deiconify()
+                dialog.lift()
+                dialog.grab_set()
+                return dialog
+            # 服务已重新加载，丢弃基于旧服务创建的对话框
+            dialog.destroy()
+        
+        dialog = create(self.root, service)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: self._hide_cached_dialog(dialog, on_close))
+        self._cached_dialogs[key] = (service, dialog)
+        return dialog
+    
+    def _hide_cached_dialog(self, dialog: tk.Toplevel, on_close: Optional[Callable[[], None]]):
+        """
+        隐藏可复用的对话框
+        
+        Args:
+            dialog: 对话框窗口
+            on_close: 对话框关闭后调用的函数
+        """
+        dialog.grab_release()
+        dialog.withdraw()
+        if on_close is not None:
+            self.root.after_idle(on_close)
+    
+    def _schedule_refresh(self, *targets: str):
+        """
+        安排一次刷新，短时间内重复的请求会合并
+        
+        Args:
+            targets: 刷新目标，'ui'、'file_tree' 或 'category_tree'
+        """
+        self._pending_refreshes.update(targets)
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(REFRESH_DEBOUNCE_MS, self._flush_refreshes)
+    
+    def _flush_refreshes(self):
+        """执行所有待执行的刷新，每个目标只执行一次"""
+        self._refresh_after_id = None
+        pending = self._pending_refreshes
+        self._pending_refreshes = set()
+        
+        # 刷新UI时已包含分类树
+        if 'ui' in pending:
+            pending.discard('category_tree')
+            self._refresh_ui()
+        if 'category_tree' in pending and self.category_tree is not None:
+            self._populate_category_tree()
+        if 'file_tree' in pending and self.file_manager_panel is not None:
+            self.file_manager_panel._refresh_files()
+    
     def _refresh_ui(self):
         """刷新UI界面"""
         try:
-            # 刷新可能需要更新的UI组件
-            if hasattr(self, 'status_bar'):
-                self.status_bar.update_status("UI已刷新")
-            
             # 刷新分类树
-            if hasattr(self, 'category_tree'):
+            if self.category_tree is not None:
                 self._populate_category_tree()
-                logger.info("分类树已刷新")
+                logger.debug("分类树已刷新")
             
             # 如果有其他需要刷新的UI组件，在这里添加
             
-            logger.info("UI已刷新")
+            logger.debug("UI已刷新")
         except Exception as e:
-            logger.error(f"刷新UI时发生错误: {e}")
+            logger.error("刷新UI时发生错误: %s", e)
         
-    def _on_preferences(self):
+    def _on_preferences(self, event=None):
         """打开首选项对话框"""
         # 临时实现，后续可以添加实际的首选项对话框
-        messagebox.showinfo("首选项", "首选项功能正在开发中...")
+        self._notify('info', "首选项功能正在开发中...")
 
     def _on_tab_changed(self, event=None):
         """处理标签页切换事件"""
         # 记录标签页切换
-        current_tab = self.notebook.select()
-        tab_id = self.notebook.index(current_tab)
-        tab_name = self.notebook.tab(tab_id, "text")
-        logger.info(f"选项卡切换: {tab_name}")
+        tab_name = self._tab_texts.get(self.notebook.select(), "")
+        logger.info("选项卡切换: %s", tab_name)
+        
+        # 首次切换到服务管理标签页时才创建其内容，创建时会加载服务列表
+        if tab_name == "服务管理" and not self._service_panel_built:
+            self._service_panel_built = True
+            self.service_tab.after_idle(self._build_service_panel)
+            return
         
         # 如果切换到服务管理标签页，更新服务列表
-        if tab_name == "服务管理" and hasattr(self, 'service_manager_panel'):
-            # 仅当面板存在时刷新
-            if hasattr(self.service_manager_panel, '_refresh_services'):
-                self.service_manager_panel._refresh_services()
+        if tab_name == "服务管理" and self.service_manager_panel is not None:
+            self.service_manager_panel._refresh_services()
 
-    def _on_category_selected(self, event):
+    def _on_category_selected(self, event=None):
         """
-        处理分类选择事件
+        处理分类选择事件，连续的选择变化合并为一次分类信息更新
         
         Args:
             event: 事件对象
         """
-        # 获取选中的分类项
+        if self._selection_refresh_id is not None:
+            self.root.after_cancel(self._selection_refresh_id)
+        self._selection_refresh_id = self.root.after(SELECTION_DEBOUNCE_MS, self._update_category_info)
+
+    def _update_category_info(self):
+        """根据当前选中的分类更新分类信息和删除按钮状态"""
+        self._selection_refresh_id = None
+        
+        # 获取选中的分类项，只有选中分类时删除按钮才可用
         selection = self.category_tree.selection()
+        self.del_category_btn.state(["!disabled"] if selection else ["disabled"])
         if not selection:
             return
         
@@ -1149,36 +1477,37 @@ class AudioTranslatorGUI:
         
         # 如果选择的是根节点，清空信息显示
         if category_id == "root":
-            self.category_path_var.set("")
-            self.category_count_var.set("")
-            self.category_type_var.set("")
+            self._set_category_info("", "", "")
             return
         
-        # 获取分类信息
-        category_info = self.category_tree.item(category_id, "values")
-        category_name = self.category_tree.item(category_id, "text")
+        # 获取分类信息，节点和父节点信息通过一次Tcl调用取回
+        tree = self.category_tree
+        category_name, category_info, parent_id, parent_name = tree.tk.splitlist(
+            tree.tk.call("apply", _NODE_INFO_LAMBDA, str(tree), category_id))
+        category_info = tree.tk.splitlist(category_info)
         
-        # 显示分类信息
-        parent_id = self.category_tree.parent(category_id)
+        # 显示分类路径、该分类下的文件数量和分类类型
         if parent_id:
-            parent_name = self.category_tree.item(parent_id, "text")
-            path = f"{parent_name}/{category_name}"
-        else:
-            path = category_name
-        
-        self.category_path_var.set(path)
-        
-        # 显示该分类下的文件数量
-        if category_info and len(category_info) > 0:
-            self.category_count_var.set(category_info[0])
+            self._set_category_info(f"{parent_name}/{category_name}",
+                                    category_info[0] if category_info else "0", "子分类")
         else:
-            self.category_count_var.set("0")
+            self._set_category_info(category_name,
+                                    category_info[0] if category_info else "0", "主分类")
+
+    def _set_category_info(self, path: str, count: str, category_type: str):
+        """
+        更新分类信息显示，只设置发生变化的变量
         
-        # 显示分类类型
-        if parent_id:
-            self.category_type_var.set("子分类")
-        else:
-            self.category_type_var.set("主分类")
+        Args:
+            path: 分类路径
+            count: 文件数量
+            category_type: 分类类型
+        """
+        for var, value in ((self.category_path_var, path),
+                           (self.category_count_var, str(count)),
+                           (self.category_type_var, category_type)):
+            if var.get() != value:
+                var.set(value)
 
     def _on_category_double_click(self, event):
         """
@@ -1196,15 +1525,15 @@ class AudioTranslatorGUI:
         category_id = selection[0]
         
         # 获取分类信息
-        category_name = self.category_tree.item(category_id, "text")
+        item = self.category_tree.item(category_id)
+        category_name = item["text"]
         
         # 如果是折叠状态，展开该分类；如果是展开状态，折叠该分类
-        if self.category_tree.item(category_id, "open"):
-            self.category_tree.item(category_id, open=False)
-        else:
-            self.category_tree.item(category_id, open=True)
+        if not item["open"]:
+            self._expand_lazy_node(category_id)
+        self.category_tree.item(category_id, open=not item["open"])
         
-        logger.info(f"分类 '{category_name}' 被双击")
+        logger.info("分类 '%s' 被双击", category_name)
 
     def _show_category_context_menu(self, event):
         """
@@ -1217,24 +1546,114 @@ class AudioTranslatorGUI:
         item_id = self.category_tree.identify_row(event.y)
         if item_id:
             self.category_tree.selection_set(item_id)
-            
-            # 创建右键菜单
-            context_menu = tk.Menu(self.category_tree, tearoff=0)
-            
-            # 添加菜单项
-            context_menu.add_command(label="添加子分类", 
-                                     command=lambda: self._on_add_subcategory(item_id))
-            context_menu.add_command(label="重命名分类", 
-                                     command=lambda: self._on_rename_category(item_id))
-            context_menu.add_separator()
-            context_menu.add_command(label="删除分类", 
-                                     command=lambda: self._on_delete_category(item_id))
+            self._ctx_item = item_id
             
             # 显示菜单
             try:
-                context_menu.tk_popup(event.x_root, event.y_root)
+                self._category_context_menu.tk_popup(event.x_root, event.y_root)
             finally:
-                context_menu.grab_release()
+                self._category_context_menu.grab_release()
+
+    def _index_category_rows(self, rows):
+        """
+        将批量插入的分类节点登记到名称索引
+        
+        Args:
+            rows: (父节点ID, 节点ID, 选项) 形式的节点列表
+        """
+        index = self._cat_name_index
+        for parent, node_id, options in rows:
+            if not node_id.startswith(LAZY_NODE_PREFIX):
+                index.setdefault(parent, {})[options["text"]] = node_id
+
+    def _on_category_tree_open(self, event=None):
+        """分类节点展开时填充其延迟加载的子分类"""
+        self._expand_lazy_node(self.category_tree.focus())
+
+    def _expand_lazy_node(self, node_id):
+        """
+        将节点下的占位子节点替换为真实的子分类
+        
+        Args:
+            node_id: 分类树节点ID，未延迟加载的节点直接忽略
+        """
+        entry = self._lazy_nodes.pop(node_id, None)
+        if entry is None:
+            return
+        cat_id, depth = entry
+        self.category_tree.delete(LAZY_NODE_PREFIX + node_id)
+        self._add_subcategories(cat_id, node_id, depth=depth)
+
+    def _run_category_op(self, service: Any, method_name: str, args: tuple,
+                         on_success: Callable[[], None], error_message: str):
+        """
+        在后台线程中执行分类服务调用，完成后在主线程中更新界面
+        
+        分类操作在同一个线程中按提交顺序执行，避免并发修改和保存分类数据。
+        
+        Args:
+            service: 分类服务
+            method_name: 分类服务方法名
+            args: 调用参数
+            on_success: 调用成功后在主线程中执行的回调
+            error_message: 失败时显示的错误信息前缀
+        """
+        try:
+            func = getattr(service, method_name)
+            future = self._category_executor.submit(func, *args)
+        except Exception as e:
+            logger.error("%s: %s", error_message, e)
+            messagebox.showerror("错误", f"{error_message}: {e}", parent=self.root)
+            return
+        self.root.after(MOVE_POLL_MS, self._poll_category_op, future, on_success, error_message)
+
+    def _poll_category_op(self, future: Future, on_success: Callable[[], None], error_message: str):
+        """
+        等待后台分类服务调用完成
+        
+        Args:
+            future: 后台调用的Future
+            on_success: 调用成功后执行的回调
+            error_message: 失败时显示的错误信息前缀
+        """
+        if not future.done():
+            self.root.after(MOVE_POLL_MS, self._poll_category_op, future, on_success, error_message)
+            return
+        
+        try:
+            result = future.result()
+        except Exception as e:
+            logger.error("%s: %s", error_message, e)
+            messagebox.showerror("错误", f"{error_message}: {e}", parent=self.root)
+            return
+        
+        # 分类服务以返回False表示操作未执行
+        if not result:
+            logger.error("%s: 分类服务未完成操作", error_message)
+            messagebox.showerror("错误", error_message, parent=self.root)
+            return
+        
+        # 分类已变化，之前记录的子分类列表不再可靠
+        self._subcategory_snapshot.clear()
+        on_success()
+
+    @staticmethod
+    def _new_category_id(category_service, base_id: str) -> str:
+        """
+        为新建的分类生成未被占用的分类ID
+        
+        Args:
+            category_service: 分类服务
+            base_id: 期望的分类ID，已被占用时添加数字后缀
+            
+        Returns:
+            分类ID
+        """
+        cat_id = base_id
+        suffixes = itertools.count(2)
+        while category_service.get_category(cat_id) is not None:
+            cat_id = f"{base_id}{next(suffixes)}"
+        return cat_id
 
     def _on_add_category(self):
         """添加新的主分类"""
@@ -1246,47 +1665,38 @@ class AudioTranslatorGUI:
             return
         
         # 检查分类名称是否已存在
-        existing_categories = []
-        for item_id in self.category_tree.get_children():
-            item_text = self.category_tree.item(item_id, "text")
-            existing_categories.append(item_text)
-        
-        if category_name in existing_categories:
+        if category_name in self._cat_name_index.get("", {}):
             messagebox.showerror("错误", f"分类 '{category_name}' 已存在！", parent=self.root)
             return
 
         # 获取分类服务
-        category_service = self.service_factory.get_service("category_service")
+        category_service = self.category_service
         if not category_service:
             messagebox.showerror("错误", "分类服务不可用，无法添加分类！", parent=self.root)
             return
 
-        # 添加分类
-        try:
-            # 创建分类字典
-            category_data = {
-                "name": category_name,
-                "path": category_name,
-                "parent": None,
-                "level": 0,
-                "count": 0
-            }
-            
-            # 添加到分类服务
-            category_service.add_category(category_data)
-            
+        # 创建分类对象
+        category = Category(
+            cat_id=self._new_category_id(category_service, category_name.strip()),
+            name_en=category_name,
+            name_zh=category_name
+        )
+        
+        def on_added():
             # 添加到分类树
-            category_id = self.category_tree.insert("", "end", text=category_name, values=("0"))
+            category_id = self.category_tree.insert("", "end", text=category_name, values=(category.count,))
+            self._cat_name_index.setdefault("", {})[category_name] = category_id
+            self._node_cat_ids[category_id] = category.cat_id
             
             # 选择新添加的分类
             self.category_tree.selection_set(category_id)
             self.category_tree.see(category_id)
             
-            logger.info(f"成功添加分类: {category_name}")
-            messagebox.showinfo("成功", f"分类 '{category_name}' 添加成功！", parent=self.root)
-        except Exception as e:
-            logger.error(f"添加分类失败: {str(e)}")
-            messagebox.showerror("错误", f"添加分类失败: {str(e)}", parent=self.root)
+            logger.info("成功添加分类: %s", category_name)
+            self._notify('info', f"分类 '{category_name}' 添加成功！")
+        
+        # 在后台线程中添加到分类服务，完成后再更新分类树
+        self._run_category_op(category_service, "add_category", (category,), on_added, "添加分类失败")
 
     def _on_add_subcategory(self, parent_id):
         """
@@ -1307,39 +1717,40 @@ class AudioTranslatorGUI:
         if not subcategory_name or subcategory_name.strip() == "":
             return
         
-        # 检查子分类名称是否已存在
-        existing_subcategories = []
-        for item_id in self.category_tree.get_children(parent_id):
-            item_text = self.category_tree.item(item_id, "text")
-            existing_subcategories.append(item_text)
-        
-        if subcategory_name in existing_subcategories:
+        # 检查子分类名称是否已存在（先加载尚未展开的子分类）
+        self._expand_lazy_node(parent_id)
+        if subcategory_name in self._cat_name_index.get(parent_id, {}):
             messagebox.showerror("错误", f"子分类 '{subcategory_name}' 已存在于 '{parent_name}' 下！", 
                                 parent=self.root)
             return
         
         # 获取分类服务
-        category_service = self.service_factory.get_service("category_service")
+        category_service = self.category_service
         if not category_service:
             messagebox.showerror("错误", "分类服务不可用，无法添加子分类！", parent=self.root)
             return
         
-        # 添加子分类
-        try:
-            # 创建子分类字典
-            subcategory_data = {
-                "name": subcategory_name,
-                "path": f"{parent_name}/{subcategory_name}",
-                "parent": parent_name,
-                "level": 1,
-                "count": 0
-            }
-            
-            # 添加到分类服务
-            category_service.add_category(subcategory_data)
+        # 创建子分类对象，父分类通过分类ID关联
+        parent_cat_id = self._node_cat_ids.get(parent_id)
+        if parent_cat_id is None:
+            messagebox.showerror("错误", f"找不到分类 '{parent_name}'，无法添加子分类！", parent=self.root)
+            return
+        subcategory = Category(
+            cat_id=self._new_category_id(category_service, f"{parent_cat_id}_{subcategory_name.strip()}"),
+            name_en=subcategory_name,
+            name_zh=subcategory_name,
+            parent_id=parent_cat_id
+        )
+        
+        def on_added():
+            # 父分类可能已在分类树重建时被移除
+            if not self.category_tree.exists(parent_id):
+                return
             
             # 添加到分类树
-            subcategory_id = self.category_tree.insert(parent_id, "end", text=subcategory_name, values=(subcategory.count if hasattr(subcategory, 'count') else 0,))
+            subcategory_id = self.category_tree.insert(parent_id, "end", text=subcategory_name, values=(subcategory.count,))
+            self._cat_name_index.setdefault(parent_id, {})[subcategory_name] = subcategory_id
+            self._node_cat_ids[subcategory_id] = subcategory.cat_id
             
             # 展开父分类
             self.category_tree.item(parent_id, open=True)
@@ -1348,11 +1759,11 @@ class AudioTranslatorGUI:
             self.category_tree.selection_set(subcategory_id)
             self.category_tree.see(subcategory_id)
             
-            logger.info(f"成功添加子分类: {parent_name}/{subcategory_name}")
-            messagebox.showinfo("成功", f"子分类 '{subcategory_name}' 添加成功！", parent=self.root)
-        except Exception as e:
-            logger.error(f"添加子分类失败: {str(e)}")
-            messagebox.showerror("错误", f"添加子分类失败: {str(e)}", parent=self.root)
+            logger.info("成功添加子分类: %s/%s", parent_name, subcategory_name)
+            self._notify('info', f"子分类 '{subcategory_name}' 添加成功！")
+        
+        # 在后台线程中添加到分类服务，完成后再更新分类树
+        self._run_category_op(category_service, "add_category", (subcategory,), on_added, "添加子分类失败")
 
     def _on_rename_category(self, category_id):
         """
@@ -1380,43 +1791,48 @@ class AudioTranslatorGUI:
         if not new_name or new_name.strip() == "" or new_name == current_name:
             return
         
-        # 检查新名称是否已存在
-        existing_names = []
-        for item_id in self.category_tree.get_children(parent_id):
-            if item_id != category_id:  # 排除当前分类
-                item_text = self.category_tree.item(item_id, "text")
-                existing_names.append(item_text)
-        
-        if new_name in existing_names:
+        # 检查新名称是否已存在（新名称与当前名称不同，无需排除当前分类）
+        if new_name in self._cat_name_index.get(parent_id, {}):
             messagebox.showerror("错误", f"分类 '{new_name}' 已存在！", parent=self.root)
             return
         
         # 获取分类服务
-        category_service = self.service_factory.get_service("category_service")
+        category_service = self.category_service
         if not category_service:
             messagebox.showerror("错误", "分类服务不可用，无法重命名分类！", parent=self.root)
             return
         
-        # 重命名分类
-        try:
-            # 构建分类路径
-            old_path = current_name
-            new_path = new_name
-            if parent_name:
-                old_path = f"{parent_name}/{current_name}"
-                new_path = f"{parent_name}/{new_name}"
-            
-            # 更新分类服务中的分类
-            category_service.rename_category(old_path, new_path)
+        # 取得节点对应的分类，只修改显示用的中文名称，分类ID保持不变
+        cat_id = self._node_cat_ids.get(category_id)
+        category = category_service.get_category(cat_id) if cat_id else None
+        if category is None:
+            messagebox.showerror("错误", f"找不到分类 '{current_name}'，无法重命名！", parent=self.root)
+            return
+        renamed = dataclasses.replace(category, name_zh=new_name)
+        
+        # 构建分类路径
+        old_path = current_name
+        new_path = new_name
+        if parent_name:
+            old_path = f"{parent_name}/{current_name}"
+            new_path = f"{parent_name}/{new_name}"
+        
+        def on_renamed():
+            # 节点可能已在分类树重建时被移除
+            if not self.category_tree.exists(category_id):
+                return
             
             # 更新分类树中的分类名称
             self.category_tree.item(category_id, text=new_name)
+            siblings = self._cat_name_index.setdefault(parent_id, {})
+            siblings.pop(current_name, None)
+            siblings[new_name] = category_id
             
-            logger.info(f"成功重命名分类: '{old_path}' -> '{new_path}'")
-            messagebox.showinfo("成功", f"分类重命名成功: '{current_name}' -> '{new_name}'", parent=self.root)
-        except Exception as e:
-            logger.error(f"重命名分类失败: {str(e)}")
-            messagebox.showerror("错误", f"重命名分类失败: {str(e)}", parent=self.root)
+            logger.info("成功重命名分类: '%s' -> '%s'", old_path, new_path)
+            self._notify('info', f"分类重命名成功: '{current_name}' -> '{new_name}'")
+        
+        # 在后台线程中更新分类服务中的分类，完成后再更新分类树
+        self._run_category_op(category_service, "update_category", (cat_id, renamed), on_renamed, "重命名分类失败")
 
     def _on_delete_category(self, category_id=None):
         """
@@ -1429,7 +1845,7 @@ class AudioTranslatorGUI:
         if category_id is None:
             selection = self.category_tree.selection()
             if not selection:
-                messagebox.showinfo("提示", "请先选择要删除的分类！", parent=self.root)
+                self._notify('info', "请先选择要删除的分类！")
                 return
             category_id = selection[0]
         
@@ -1448,7 +1864,7 @@ class AudioTranslatorGUI:
             return
         
         # 获取分类服务
-        category_service = self.service_factory.get_service("category_service")
+        category_service = self.category_service
         if not category_service:
             messagebox.showerror("错误", "分类服务不可用，无法删除分类！", parent=self.root)
             return
@@ -1459,26 +1875,36 @@ class AudioTranslatorGUI:
         if parent_id:
             parent_name = self.category_tree.item(parent_id, "text")
         
+        # 分类服务按分类ID删除分类
+        cat_id = self._node_cat_ids.get(category_id)
+        if cat_id is None:
+            messagebox.showerror("错误", f"找不到分类 '{category_name}'，无法删除！", parent=self.root)
+            return
+        
         # 构建分类路径
         category_path = category_name
         if parent_name:
             category_path = f"{parent_name}/{category_name}"
         
-        # 删除分类
-        try:
-            # 从分类服务中删除分类
-            category_service.delete_category(category_path)
+        def on_deleted():
+            # 节点可能已在分类树重建时被移除
+            if not self.category_tree.exists(category_id):
+                return
             
             # 从分类树中删除分类
             self.category_tree.delete(category_id)
+            self._cat_name_index.get(parent_id, {}).pop(category_name, None)
+            self._cat_name_index.pop(category_id, None)
+            self._node_cat_ids.pop(category_id, None)
+            self._lazy_nodes.pop(category_id, None)
             
-            logger.info(f"成功删除分类: {category_path}")
-            messagebox.showinfo("成功", f"分类 '{category_name}' 删除成功！", parent=self.root)
-        except Exception as e:
-            logger.error(f"删除分类失败: {str(e)}")
-            messagebox.showerror("错误", f"删除分类失败: {str(e)}", parent=self.root)
+            logger.info("成功删除分类: %s", category_path)
+            self._notify('info', f"分类 '{category_name}' 删除成功！")
+        
+        # 在后台线程中从分类服务中删除分类，完成后再更新分类树
+        self._run_category_op(category_service, "delete_category", (cat_id,), on_deleted, "删除分类失败")
 
-    def _open_directory(self):
+    def _open_directory(self, event=None):
         """打开文件夹对话框并加载选择的目录"""
         from tkinter import filedialog
         directory = filedialog.askdirectory(title="选择文件夹")
@@ -1486,34 +1912,119 @@ class AudioTranslatorGUI:
             # 更新当前目录变量
             self.current_directory.set(directory)
             # 使用文件管理面板加载目录
+            self._last_refresh_mtime[directory] = self._directory_mtime(directory)
             self.file_manager_panel.load_directory(directory)
-            logger.info(f"已打开目录: {directory}")
+            logger.info("已打开目录: %s", directory)
+            
+    @staticmethod
+    def _directory_mtime(directory: str) -> Optional[int]:
+        """
+        获取目录的修改时间
+        
+        Args:
+            directory: 目录路径
             
-    def _refresh_current_directory(self):
-        """刷新当前目录"""
+        Returns:
+            修改时间（纳秒），目录无法访问时返回None
+        """
+        try:
+            return os.stat(directory).st_mtime_ns
+        except OSError:
+            return None
+
+    def _refresh_current_directory(self, event=None, force: bool = False):
+        """
+        刷新当前目录
+        
+        目录的修改时间只在其中的条目增加、删除或重命名时变化，
+        未变化时跳过重新加载；force 为 True 时总是重新加载。
+        
+        Args:
+            event: 事件对象
+            force: 是否忽略修改时间强制重新加载
+        """
         # 获取当前目录
         directory = self.current_directory.get()
         
         if not directory or directory == "":
             # 如果没有选择目录，提示用户
-            messagebox.showinfo("提示", "请先选择一个目录")
+            self._notify('info', "请先选择一个目录")
             return
         
+        mtime = self._directory_mtime(directory)
+        if not force and mtime is not None and self._last_refresh_mtime.get(directory) == mtime:
+            logger.debug("目录未变化，跳过刷新: %s", directory)
+            self._update_status_bar()
+            return
+        self._last_refresh_mtime[directory] = mtime
+        
         # 刷新文件管理面板
         self.file_manager_panel.load_directory(directory)
         
         # 记录日志
-        logger.info(f"刷新目录: {directory}")
+        logger.info("刷新目录: %s", directory)
         
         # 更新状态栏
         self._update_status_bar()
             
+    def _create_fallback_category_service(self) -> bool:
+        """
+        服务工厂中没有分类服务时，直接创建并初始化一个分类服务实例
+        
+        Returns:
+            是否创建成功
+        """
+        try:
+            from ..services.business.category.category_service import CategoryService
+            category_service = CategoryService()
+            
+            # 初始化新创建的分类服务
+            if category_service.initialize():
+                self.category_service = category_service
+                self.services_status["category_service"] = True
+                self.category_manager.set_category_service(category_service)
+                logger.info("成功创建并初始化category_service")
+                
+                # 注册到服务工厂
+                self.service_factory.register_service(category_service)
+                logger.info("已将新创建的category_service注册到服务工厂")
+                return True
+        except Exception as e:
+            logger.error("创建分类服务失败: %s", e)
+        return False
+    
+    def _load_initial_category_tree(self):
+        """首次填充分类树，完成后清除占位文本"""
+        try:
+            if not self.category_service:
+                self._create_fallback_category_service()
+            
+            # 分类服务的备用实例创建之后再显示服务状态，避免误报分类服务缺失
+            self._show_services_status()
+            
+            if not self.category_service:
+                logger.error("分类服务未设置")
+                return
+            self._populate_category_tree()
+        finally:
+            if self.category_path_var.get() == "加载中…":
+                self.category_path_var.set("")
+    
+    def _get_categories_cached(self) -> Dict[str, Any]:
+        """
+        获取所有分类，分类数据版本号未变化时复用上次的结果
+        
+        Returns:
+            所有分类的字典，键为分类ID，值为分类对象
+        """
+        version = self.category_manager.get_categories_version()
+        if self._categories_cache is None or version < 0 or version != self._categories_cache_version:
+            self._categories_cache = self.category_manager.get_all_categories()
+            self._categories_cache_version = version
+        return self._categories_cache
+    
     def _populate_category_tree(self):
         """加载分类树数据"""
-        # 清空现有分类树
-        for item in self.category_tree.get_children():
-            self.category_tree.delete(item)
-        
         # 使用已有的分类管理器而不是创建新实例
         if not self.category_manager:
             logger.error("分类管理器未初始化，分类树加载失败")
@@ -1528,30 +2039,41 @@ class AudioTranslatorGUI:
                 logger.error("分类服务未设置，分类树加载失败")
                 return
         
+        # 分类数据未变化且缓存未失效时，保留当前的分类树
+        version = self.category_manager.get_categories_version()
+        children = self.category_tree.get_children()
+        if (children and version >= 0 and version == self._category_tree_version
+                and self._categories_cache is not None):
+            logger.debug("分类数据未变化，跳过分类树重建")
+            return
+        
+        # 清空现有分类树
+        if children:
+            self.category_tree.delete(*children)
+        self._cat_name_index.clear()
+        self._node_cat_ids.clear()
+        self._lazy_nodes.clear()
+        self._subcategory_snapshot.clear()
+        self._category_tree_version = -1
+        
         try:
             # 获取所有分类
-            categories = self.category_manager.get_all_categories()
+            categories = self._get_categories_cached()
             if not categories:
                 logger.warning("未找到任何分类")
                 return
             
             # 添加根分类
-            root_categories = {}
-            
             # 筛选出根分类（没有parent_id或subcategory为空的分类）
-            for cat_id, category in categories.items():
-                is_root = (not hasattr(category, 'parent_id') or not category.parent_id)
-                if is_root:
-                    root_categories[cat_id] = category
+            root_categories = {cat_id: category for cat_id, category in categories.items()
+                               if not getattr(category, 'parent_id', None)}
             
             # 如果没有找到明确的根分类，使用不是其他分类子分类的分类作为根分类
             if not root_categories:
                 logger.info("未找到明确的根分类，尝试推断根分类")
                 # 创建一个集合来存储所有作为子分类的ID
-                child_ids = set()
-                for cat_id, category in categories.items():
-                    if hasattr(category, 'parent_id') and category.parent_id:
-                        child_ids.add(category.parent_id)
+                child_ids = {category.parent_id for category in categories.values()
+                             if getattr(category, 'parent_id', None)}
                 
                 # 不在child_ids中的分类ID可以视为根分类
                 for cat_id, category in categories.items():
@@ -1561,53 +2083,105 @@ class AudioTranslatorGUI:
             # 对根分类按名称排序
             sorted_root_categories = list(root_categories.values())
             try:
-                sorted_root_categories.sort(key=lambda x: x.name_zh.lower() if hasattr(x, 'name_zh') else '')
+                sorted_root_categories.sort(key=_category_sort_key)
             except Exception as e:
-                logger.error(f"排序根分类失败: {e}")
+                logger.error("排序根分类失败: %s", e)
+            
+            # 先收集所有节点，最后一次性插入，避免逐个节点调用Tcl
+            rows = []
             
-            # 添加根分类，带交替行颜色
+            # 添加根分类，带交替行颜色；子分类在展开时才加载
             for i, category in enumerate(sorted_root_categories):
                 try:
                     # 确定行标签（奇数行或偶数行）
                     row_tags = ('odd',) if i % 2 == 0 else ('even',)
-                    
-                    # 创建分类节点
-                    node_id = self.category_tree.insert(
-                        "", "end", 
-                        text=category.name_zh if hasattr(category, 'name_zh') else category.cat_id,
-                        values=(category.count if hasattr(category, 'count') else 0,),
-                        tags=row_tags  # 应用行标签
-                    )
-                    
-                    # 递归添加子分类
-                    self._add_subcategories(category.cat_id, node_id, self.category_manager, depth=1)
+                    self._append_category_row(rows, "", category, row_tags, 1, self.category_manager)
                 except Exception as e:
-                    logger.error(f"添加根分类节点失败: {e}, 分类ID: {category.cat_id if hasattr(category, 'cat_id') else '未知'}")
+                    logger.error("添加根分类节点失败: %s, 分类ID: %s", e, getattr(category, 'cat_id', '未知'))
                     continue
+            
+            treeview_bulk_insert(self.category_tree, rows)
+            self._index_category_rows(rows)
+            self._category_tree_version = version
                 
             # 更新标题显示分类数量
-            title_text = f"分类管理 (共{len(categories)}个分类)"
-            # 直接更新分类区域的标题
-            for widget in self.category_area.winfo_children():
-                if isinstance(widget, ttk.LabelFrame) or isinstance(widget, ttk.Frame):
-                    for child in widget.winfo_children():
-                        if isinstance(child, ttk.Label) and "分类管理" in child.cget("text"):
-                            child.config(text=title_text)
-                            break
+            self.category_title_label.config(text=f"分类管理 (共{len(categories)}个分类)")
         except Exception as e:
-            logger.error(f"加载分类树时发生错误: {e}")
+            logger.error("加载分类树时发生错误: %s", e)
             import traceback
             logger.error(traceback.format_exc())
 
-    def _add_subcategories(self, parent_id, tree_parent, category_manager=None, depth=1):
-        """递归添加子分类
+    def _append_category_row(self, rows, tree_parent, category, row_tags, child_depth, category_manager):
+        """
+        收集一个分类节点，有子分类时附带一个占位子节点
+        
+        Args:
+            rows: 待批量插入的节点列表
+            tree_parent: 树中的父节点ID
+            category: 分类对象
+            row_tags: 行标签
+            child_depth: 子分类所在的深度
+            category_manager: 分类管理器实例
+        """
+        node_id = f"cat_{next(self._category_iid_counter)}"
+        rows.append((tree_parent, node_id, {
+            "text": getattr(category, 'name_zh', category.cat_id),
+            "values": (category.count,),
+            "tags": row_tags  # 应用行标签
+        }))
+        self._node_cat_ids[node_id] = category.cat_id
+        
+        # 占位子节点使展开标记可见，真正的子分类在展开时加载
+        if self._sorted_subcategories(category.cat_id, category_manager):
+            rows.append((node_id, LAZY_NODE_PREFIX + node_id, {}))
+            self._lazy_nodes[node_id] = (category.cat_id, child_depth)
+
+    def _sorted_subcategories(self, parent_id, category_manager):
+        """
+        获取按名称排序的子分类列表
+        
+        同一分类先在插入占位节点时查询，展开时再次使用，
+        结果在分类树重建前保留，避免重复查询和排序。
+        
+        Args:
+            parent_id: 父分类ID
+            category_manager: 分类管理器实例
+            
+        Returns:
+            子分类列表
+        """
+        subcategories = self._subcategory_snapshot.get(parent_id)
+        if subcategories is None:
+            subcategories = list(category_manager.get_subcategories(parent_id).values())
+            try:
+                # 按中文名称排序
+                subcategories.sort(key=_category_sort_key)
+            except Exception as e:
+                logger.error("排序子分类时出错: %s", e)
+                # 如果排序失败，仍然可以显示未排序的子分类
+            self._subcategory_snapshot[parent_id] = subcategories
+        return subcategories
+
+    def _add_subcategories(self, parent_id, tree_parent, category_manager=None, depth=1, rows=None):
+        """添加一层子分类
+        
+        只添加直接子分类，下级分类以占位节点表示，在节点展开时再加载。
         
         Args:
             parent_id: 父分类ID
             tree_parent: 树中的父节点ID
             category_manager: 分类管理器实例，如果未提供则使用self.category_manager
             depth: 当前深度，用于决定奇偶行标签
+            rows: 待批量插入的节点列表，提供时只收集节点而不立即插入
         """
+        # 未提供节点列表时，收集完本层的节点后立即插入
+        if rows is None:
+            rows = []
+            self._add_subcategories(parent_id, tree_parent, category_manager, depth, rows)
+            treeview_bulk_insert(self.category_tree, rows)
+            self._index_category_rows(rows)
+            return
+        
         # 如果未提供分类管理器，使用已有的实例
         if category_manager is None:
             category_manager = self.category_manager
@@ -1615,51 +2189,29 @@ class AudioTranslatorGUI:
         if not category_manager or not category_manager.category_service:
             logger.error("分类管理器或分类服务未设置，无法添加子分类")
             return
-            
-        # 获取子分类（字典形式）
-        subcategories_dict = category_manager.get_subcategories(parent_id)
-        if not subcategories_dict:
-            return
-        
-        # 将字典值转换为列表并按名称排序
-        subcategories_list = list(subcategories_dict.values())
-        try:
-            # 按中文名称排序
-            subcategories_list.sort(key=lambda x: x.name_zh.lower() if hasattr(x, 'name_zh') else '')
-        except Exception as e:
-            logger.error(f"排序子分类时出错: {e}")
-            # 如果排序失败，仍然可以显示未排序的子分类
         
         # 添加子分类
-        for i, subcategory in enumerate(subcategories_list):
+        for i, subcategory in enumerate(self._sorted_subcategories(parent_id, category_manager)):
             try:
                 # 确定行标签（奇数行或偶数行）- 根据深度和索引计算
                 # 这样可以确保同一层级的相邻节点有不同的颜色
                 row_tags = ('odd',) if (depth + i) % 2 == 0 else ('even',)
-                
-                # 创建节点
-                node_id = self.category_tree.insert(
-                    tree_parent, 
-                    "end", 
-                    text=subcategory.name_zh if hasattr(subcategory, 'name_zh') else subcategory.cat_id,
-                    values=(subcategory.count if hasattr(subcategory, 'count') else 0,),
-                    tags=row_tags  # 应用行标签
-                )
-                
-                # 递归添加子分类的子分类
-                self._add_subcategories(subcategory.cat_id, node_id, category_manager, depth + 1)
+                self._append_category_row(rows, tree_parent, subcategory, row_tags, depth + 1, category_manager)
             except Exception as e:
-                logger.error(f"添加子分类节点时出错: {e}, 分类ID: {subcategory.cat_id if hasattr(subcategory, 'cat_id') else '未知'}")
+                logger.error("添加子分类节点时出错: %s, 分类ID: %s", e, getattr(subcategory, 'cat_id', '未知'))
                 continue
 
-    def _on_open_translation_strategy_dialog(self):
+    def _on_open_translation_strategy_dialog(self, event=None):
         """打开翻译策略配置对话框"""
         translation_manager = self.service_factory.get_service('translation_manager_service')
         if translation_manager:
-            dialog = create_translation_strategy_dialog(self.root, translation_manager)
-            self.root.wait_window(dialog)
+            create_translation_strategy_dialog = self._load_dialog(
+                'translation_strategy', '.dialogs.translation.translation_strategy_ui',
+                'create_translation_strategy_dialog'
+            )
             # 对话框关闭后更新策略信息
-            self._update_strategy_info()
+            self._show_cached_dialog('translation_strategy', translation_manager,
+                                     create_translation_strategy_dialog, self._update_strategy_info)
         else:
             messagebox.showerror("错误", "无法获取翻译管理器服务")
             
@@ -1667,7 +2219,7 @@ class AudioTranslatorGUI:
         """更新翻译策略信息"""
         try:
             translation_manager = self.service_factory.get_service('translation_manager_service')
-            if translation_manager and hasattr(self, 'strategy_info'):
+            if translation_manager and self.strategy_info is not None:
                 default_strategy_name = translation_manager.config.get('default_strategy', '未设置')
                 if default_strategy_name != '未设置':
                     strategy = translation_manager.get_translation_strategy(default_strategy_name)
@@ -1677,17 +2229,18 @@ class AudioTranslatorGUI:
                         return
                 self.strategy_info.set("当前翻译策略: 未设置")
         except Exception as e:
-            logger.error(f"更新翻译策略信息失败: {e}")
-            if hasattr(self, 'strategy_info'):
+            logger.error("更新翻译策略信息失败: %s", e)
+            if self.strategy_info is not None:
                 self.strategy_info.set("当前翻译策略: 获取失败")
     
-    def _on_open_naming_rule_dialog(self):
+    def _on_open_naming_rule_dialog(self, event=None):
         """打开命名规则配置对话框"""
         naming_service = self.service_factory.get_service('naming_service')
         if naming_service:
-            dialog = create_naming_rule_dialog(self.root, naming_service)
-            self.root.wait_window(dialog)
-            # 对话框关闭后可以添加任何需要的更新操作
+            create_naming_rule_dialog = self._load_dialog(
+                'naming_rule', '.dialogs.naming.naming_rule_ui', 'create_naming_rule_dialog'
+            )
+            self._show_cached_dialog('naming_rule', naming_service, create_naming_rule_dialog)
         else:
             messagebox.showerror("错误", "无法获取命名服务")
             
@@ -1722,5 +2275,5 @@ class AudioTranslatorGUI:
         # 记录服务状态
         services_status_str = ", ".join([f"{s}: {'✓' if status else '✗'}" 
                                         for s, status in self.services_status.items()])
-        logger.info(f"服务状态: {services_status_str}")
+        logger.info("服务状态: %s", services_status_str)
             
\ No newline at end of file
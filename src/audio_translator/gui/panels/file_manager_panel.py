@@ -12,10 +12,14 @@
 """
 
 import os
+import re
+import fnmatch
 import logging
+import platform
+import subprocess
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Dict, Any, Optional, List, Tuple, Union, Callable
+from typing import Dict, Any, Optional, List, Set, Tuple, Union, Callable
 from pathlib import Path
 import threading
 import queue
@@ -23,13 +27,25 @@ import time
 
 from ...managers.file_manager import FileManager
 from ...services.business.translator_service import TranslatorService
-from ...utils.ui_utils import create_tooltip, ScrollableFrame
+from ...utils.ui_utils import create_tooltip, ScrollableFrame, treeview_bulk_insert
 from ...utils.events import EventManager, Event
 from ..base import SimplePanel
 
 # 设置日志记录器
 logger = logging.getLogger(__name__)
 
+# 用系统默认程序打开文件的命令，Windows 使用 os.startfile（值为None）
+_OPEN_COMMAND = {
+    'Windows': None,
+    'Darwin': ('open',),  # macOS
+}.get(platform.system(), ('xdg-open',))  # 假定是Linux或其他类Unix系统
+
+# 检查打开文件命令是否结束的间隔（毫秒）
+OPEN_PROCESS_POLL_MS = 200
+
+# 搜索输入停止多久后才过滤文件列表（毫秒）
+SEARCH_DEBOUNCE_MS = 150
+
 class FileManagerPanel(SimplePanel):
     """
     文件管理面板
@@ -44,6 +60,9 @@ class FileManagerPanel(SimplePanel):
         selected_files: 当前选中的文件列表
     """
     
+    # 文件树的数据列，顺序与行值一致
+    FILE_COLUMNS = ("select", "name", "size", "type", "translated_name", "status")
+    
     def __init__(self, parent: tk.Widget, file_manager: Optional[FileManager] = None,
                  translator_service: Optional[TranslatorService] = None):
         """
@@ -67,6 +86,18 @@ class FileManagerPanel(SimplePanel):
         # 翻译状态跟踪
         self.translated_count = 0
         
+        # 已插入树中的全部行（按显示顺序），以及行ID到文件信息的映射
+        # 过滤时只分离/重新挂接这些行，而不是删除后重建
+        self._all_iids: List[str] = []
+        self._file_index: Dict[str, Tuple] = {}
+        self._iid_order: Dict[str, int] = {}
+        self._row_values: Dict[str, List[str]] = {}
+        self._selected_iids: Set[str] = set()
+        
+        # 当前排序列和方向
+        self._sort_column: Optional[str] = None
+        self._sort_reverse = False
+        
         # 列显示设置
         self.column_visibility = {
             "filename": tk.BooleanVar(value=True),
@@ -79,6 +110,7 @@ class FileManagerPanel(SimplePanel):
         # UI 变量
         self.search_var = tk.StringVar()
         self.filter_var = tk.StringVar(value="全部")
+        self._search_after_id: Optional[str] = None
         
         # 异步处理控制标志
         self._processing_active = False
@@ -201,7 +233,7 @@ class FileManagerPanel(SimplePanel):
         # 创建树视图
         self.file_tree = ttk.Treeview(
             tree_frame,
-            columns=("select", "name", "size", "type", "translated_name", "status"),
+            columns=self.FILE_COLUMNS,
             show="headings",
             selectmode="extended",
             yscrollcommand=vsb.set,
@@ -309,37 +341,26 @@ class FileManagerPanel(SimplePanel):
     def _on_file_selected(self, event) -> None:
         """处理文件选择事件"""
         try:
-            # 获取当前选中的项
+            # 获取当前选中的项，与上次的选择比较，只处理变化的行
             selected_items = self.file_tree.selection()
+            new_iids = {item_id for item_id in selected_items if item_id.startswith("item_")}
+            added = new_iids - self._selected_iids
+            removed = self._selected_iids - new_iids
+            self._selected_iids = new_iids
             
-            # 清空之前的选择
-            self.selected_files = []
+            # 更新选中文件列表，保持选择顺序
+            self.selected_files = [item_id[5:] for item_id in selected_items if item_id in new_iids]  # 移除'item_'前缀
             
-            # 处理所有项的选择状态
-            for item_id in selected_items:
-                # 从item_id中提取文件ID
-                if item_id.startswith("item_"):
-                    file_id = item_id[5:]  # 移除'item_'前缀
-                    self.selected_files.append(file_id)
-                    
-                    # 设置选中样式和标记
-                    self.file_tree.item(item_id, tags=("file", "selected"))
-                    
-                    # 更新选择列显示
-                    values = list(self.file_tree.item(item_id, "values"))
-                    values[0] = "✓"  # 添加选择标记
-                    self.file_tree.item(item_id, values=values)
-            
-            # 清除未选中项的样式
-            for item_id in self.file_tree.get_children():
-                if item_id not in selected_items:
-                    # 移除选中样式
+            # 清除取消选中项的样式和标记
+            for item_id in removed:
+                if self.file_tree.exists(item_id):
                     self.file_tree.item(item_id, tags=("file",))
-                    
-                    # 清除选择标记
-                    values = list(self.file_tree.item(item_id, "values"))
-                    values[0] = ""
-                    self.file_tree.item(item_id, values=values)
+                    self._set_row_value(item_id, 0, "")
+            
+            # 设置新选中项的样式和标记
+            for item_id in added:
+                self.file_tree.item(item_id, tags=("file", "selected"))
+                self._set_row_value(item_id, 0, "✓")
             
             # 更新状态栏
             self._update_status_bar()
@@ -388,21 +409,39 @@ class FileManagerPanel(SimplePanel):
             
         # 使用系统默认程序打开文件
         try:
-            import platform
-            import subprocess
-            
-            if platform.system() == 'Windows':
+            if _OPEN_COMMAND is None:
                 os.startfile(file_path)
-            elif platform.system() == 'Darwin':  # macOS
-                subprocess.run(['open', file_path], check=True)
-            else:  # 假定是Linux或其他类Unix系统
-                subprocess.run(['xdg-open', file_path], check=True)
-                
-            logger.info(f"已打开文件: {file_path}")
+                logger.info(f"已打开文件: {file_path}")
+            else:
+                # 不等待打开命令结束，避免阻塞界面，结果稍后再检查
+                process = subprocess.Popen(
+                    _OPEN_COMMAND + (file_path,),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    close_fds=True
+                )
+                self.after(OPEN_PROCESS_POLL_MS, self._check_open_process, process, file_path)
         except Exception as e:
             logger.error(f"打开文件失败: {str(e)}")
             messagebox.showerror("错误", f"打开文件失败: {str(e)}")
     
+    def _check_open_process(self, process: subprocess.Popen, file_path: str) -> None:
+        """
+        检查打开文件的命令是否结束，失败时提示用户
+        
+        Args:
+            process: 打开文件的进程
+            file_path: 文件路径
+        """
+        returncode = process.poll()
+        if returncode is None:
+            self.after(OPEN_PROCESS_POLL_MS, self._check_open_process, process, file_path)
+        elif returncode == 0:
+            logger.info(f"已打开文件: {file_path}")
+        else:
+            logger.error(f"打开文件失败: {file_path}, 返回码: {returncode}")
+            messagebox.showerror("错误", f"打开文件失败: {file_path}")
+    
     def _copy_file_path(self) -> None:
         """复制选中文件的路径到剪贴板"""
         selected_paths = self.get_selected_file_paths()
@@ -492,14 +531,12 @@ class FileManagerPanel(SimplePanel):
                 # 更新文件管理器中的翻译结果
                 self.file_manager.update_file_property(file_id, "translated_name", translated_name)
                 
-                # 更新树视图
-                for item_id in self.file_tree.get_children():
-                    if self.file_tree.item(item_id, 'values')[0] == file_id:
-                        values = list(self.file_tree.item(item_id, 'values'))
-                        # 更新translated_name列
-                        values[4] = translated_name  # 假设translated_name是第5列 (索引4)
-                        self.file_tree.item(item_id, values=values)
-                        break
+                # 更新树视图的translated_name列 (索引4)，并同步排序和搜索使用的文件信息
+                iid = f"item_{file_id}"
+                self._set_row_value(iid, 4, translated_name)
+                file_info = self._file_index.get(iid)
+                if file_info is not None:
+                    self._file_index[iid] = file_info[:4] + (translated_name,) + file_info[5:]
                 
                 # 增加翻译计数
                 self.translated_count += 1
@@ -570,25 +607,162 @@ class FileManagerPanel(SimplePanel):
         if self.current_directory and self.file_manager:
             self.load_directory(self.current_directory)
     
+    def update_files_status(self, file_ids: List[str], status: str) -> None:
+        """
+        只更新指定文件所在行的状态列，无需重新加载整个目录
+        
+        Args:
+            file_ids: 文件ID列表
+            status: 新的状态
+        """
+        for file_id in file_ids:
+            iid = f"item_{file_id}"
+            file_info = self._file_index.get(iid)
+            if file_info is None:
+                continue
+            self._file_index[iid] = file_info[:5] + (status,) + file_info[6:]
+            self._set_row_value(iid, 5, status)
+        
+        # 状态过滤生效时，状态改变可能影响行的可见性
+        if self.filter_var.get() != "全部":
+            self._apply_filters()
+        else:
+            self._update_status_bar()
+    
     def _sort_files(self, column) -> None:
         """
         按列排序文件
         
+        再次点击同一列时反转排序方向。排序只通过 move 调整行的位置，不删除重建行。
+        
         Args:
             column: 要排序的列名
         """
-        # 这个方法将在后续阶段实现
-        pass
+        if not self._all_iids:
+            return
+        
+        # 同一列再次点击时反转方向
+        if self._sort_column == column:
+            self._sort_reverse = not self._sort_reverse
+        else:
+            self._sort_column = column
+            self._sort_reverse = False
+        
+        # 列名到文件信息元组中的索引
+        column_index = {"name": 1, "size": 2, "type": 3, "translated_name": 4, "status": 5}
+        index = column_index.get(column)
+        if index is None:
+            return
+        
+        if column == "size":
+            key = lambda iid: self._size_to_bytes(self._file_index[iid][index])
+        else:
+            key = lambda iid: (self._file_index[iid][index] or "").lower()
+        
+        self._all_iids.sort(key=key, reverse=self._sort_reverse)
+        self._iid_order = {iid: i for i, iid in enumerate(self._all_iids)}
+        self._apply_filters()
+    
+    @staticmethod
+    def _size_to_bytes(size_str: str) -> float:
+        """
+        将格式化的大小字符串转换为字节数，用于排序
+        
+        Args:
+            size_str: 如 "1.5 MB" 的大小字符串
+            
+        Returns:
+            字节数，无法解析时返回0
+        """
+        units = {"B": 1, "KB": 1024, "MB": 1024 * 1024}
+        try:
+            value, unit = size_str.split()
+            return float(value) * units.get(unit, 1)
+        except (ValueError, AttributeError):
+            return 0
     
     def _on_search_change(self, *args) -> None:
-        """处理搜索框变更事件"""
-        # 这个方法将在后续阶段实现
-        pass
+        """处理搜索框变更事件，连续输入时只在停顿后过滤一次"""
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+        self._search_after_id = self.after(SEARCH_DEBOUNCE_MS, self._on_search_idle)
+    
+    def _on_search_idle(self) -> None:
+        """搜索输入停顿后过滤文件列表"""
+        self._search_after_id = None
+        self._apply_filters()
     
     def _on_filter_change(self, *args) -> None:
         """处理过滤选择变更事件"""
-        # 这个方法将在后续阶段实现
-        pass
+        # 过滤时会一并应用当前的搜索文本，待执行的搜索过滤不再需要
+        if self._search_after_id is not None:
+            self.after_cancel(self._search_after_id)
+            self._search_after_id = None
+        self._apply_filters()
+    
+    def _apply_filters(self) -> None:
+        """
+        根据搜索文本和状态过滤文件列表
+        
+        不匹配的行通过 detach 从树中分离但保留，匹配的行按当前顺序用 move 挂回，
+        这样过滤条件变化时不需要删除并重新插入行。
+        """
+        if not self._all_iids:
+            return
+        
+        pattern = self._compile_search_pattern(self.search_var.get())
+        status_filter = self.filter_var.get()
+        
+        # 选择了具体状态时直接从文件管理器的状态索引取候选行，并恢复显示顺序
+        if status_filter != "全部" and self.file_manager:
+            candidates = [f"item_{file_id}" for file_id in self.file_manager.get_file_ids_by_status(status_filter)]
+            candidates = [iid for iid in candidates if iid in self._iid_order]
+            candidates.sort(key=self._iid_order.__getitem__)
+        else:
+            candidates = self._all_iids
+        
+        if pattern:
+            visible = [iid for iid in candidates if pattern.search(self._file_index[iid][1])]
+        else:
+            visible = list(candidates)
+        
+        # 先分离当前显示的行，再按顺序挂回可见行
+        self.file_tree.detach(*self.file_tree.get_children())
+        for index, iid in enumerate(visible):
+            self.file_tree.move(iid, "", index)
+        
+        self._update_status_bar()
+    
+    @staticmethod
+    def _compile_search_pattern(search_text: str) -> Optional["re.Pattern"]:
+        """
+        将搜索文本编译为忽略大小写的正则表达式
+        
+        普通文本按子串匹配；包含 * 或 ? 时按通配符匹配整个文件名，如 "*.wav"。
+        
+        Args:
+            search_text: 搜索框中的文本
+            
+        Returns:
+            编译后的正则表达式，搜索文本为空时返回None
+        """
+        if not search_text:
+            return None
+        if "*" in search_text or "?" in search_text:
+            return re.compile(fnmatch.translate(search_text), re.IGNORECASE)
+        return re.compile(re.escape(search_text), re.IGNORECASE)
+    
+    def _clear_tree(self) -> None:
+        """清空文件树，包括当前被过滤分离的行"""
+        items = set(self.file_tree.get_children())
+        items.update(self._all_iids)
+        if items:
+            self.file_tree.delete(*items)
+        self._all_iids = []
+        self._file_index = {}
+        self._iid_order = {}
+        self._row_values = {}
+        self._selected_iids = set()
     
     def _update_status_bar(self) -> None:
         """更新状态栏信息"""
@@ -641,8 +815,7 @@ class FileManagerPanel(SimplePanel):
         self.current_directory = directory
         
         # 清空文件树
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        self._clear_tree()
         
         # 清空选中文件
         self.selected_files = []
@@ -663,12 +836,15 @@ class FileManagerPanel(SimplePanel):
             files: 加载的文件列表
         """
         # 清空当前树视图
-        for item in self.file_tree.get_children():
-            self.file_tree.delete(item)
+        self._clear_tree()
         
         # 添加文件到树视图
         self._insert_files_to_tree(files)
         
+        # 保持当前的搜索和过滤条件
+        if self.search_var.get() or self.filter_var.get() != "全部":
+            self._apply_filters()
+        
         # 更新状态栏
         self.update_status(f"已加载 {len(files)} 个文件")
         self._update_status_bar()
@@ -685,17 +861,55 @@ class FileManagerPanel(SimplePanel):
         Args:
             files: 文件列表
         """
+        rows = []
         for file_info in files:
             # 解包文件信息
             file_id, name, size, file_type, translated_name, status, file_path = file_info
             
-            # 添加到树视图 - 选择列应为空，将file_id存储在iid中
-            item_id = self.file_tree.insert(
-                "", "end", 
-                iid=f"item_{file_id}",  # 使用唯一ID作为树项ID
-                values=("", name, size, file_type, translated_name, status),  # 选择列为空
-                tags=("file",)
-            )
+            # 选择列为空，将file_id存储在iid中
+            iid = f"item_{file_id}"
+            self._iid_order[iid] = len(self._all_iids)
+            self._all_iids.append(iid)
+            self._file_index[iid] = file_info
+            # 行值在加载时构建一次，之后只按单元格更新
+            values = ["", name, size, file_type, translated_name, status]
+            self._row_values[iid] = values
+            rows.append(("", iid, {
+                "values": values,
+                "tags": ("file",)
+            }))
+        
+        # 一次Tcl调用插入全部行，避免逐行分派
+        treeview_bulk_insert(self.file_tree, rows)
+    
+    def _get_row_value(self, iid: str, index: int) -> str:
+        """从行值缓存读取单元格，避免向Treeview查询整行
+        
+        Args:
+            iid: 树项ID
+            index: 列索引
+            
+        Returns:
+            单元格的值，行不存在时返回空字符串
+        """
+        values = self._row_values.get(iid)
+        return values[index] if values else ""
+    
+    def _set_row_value(self, iid: str, index: int, value: str) -> None:
+        """更新单个单元格，同时同步行值缓存
+        
+        Args:
+            iid: 树项ID
+            index: 列索引
+            value: 新值
+        """
+        values = self._row_values.get(iid)
+        if values is None:
+            return
+        if values[index] == value:
+            return
+        values[index] = value
+        self.file_tree.set(iid, self.FILE_COLUMNS[index], value)
     
     def _show_column_settings(self) -> None:
         """显示列设置对话框"""
@@ -815,8 +1029,7 @@ class FileManagerPanel(SimplePanel):
             # 检查是否所有项都有选择标记
             all_selected = True
             for item_id in all_items:
-                values = self.file_tree.item(item_id, "values")
-                if values[0] != "✓":
+                if self._get_row_value(item_id, 0) != "✓":
                     all_selected = False
                     break
                     
@@ -858,9 +1071,7 @@ class FileManagerPanel(SimplePanel):
             self.file_tree.item(item_id, tags=("file", "selected"))
             
             # 更新选择列显示
-            values = list(self.file_tree.item(item_id, "values"))
-            values[0] = "✓"  # 添加选择标记
-            self.file_tree.item(item_id, values=values)
+            self._set_row_value(item_id, 0, "✓")  # 添加选择标记
             
             # 添加到选择集合
             self.file_tree.selection_add(item_id)
@@ -898,9 +1109,8 @@ class FileManagerPanel(SimplePanel):
             was_selected = item_id in selected_items
             should_select = not was_selected
             
-            # 获取当前值和更新状态
-            values = list(self.file_tree.item(item_id, "values"))
-            is_checked = values[0] == "✓" if values and len(values) >= 1 else False
+            # 获取当前选择标记
+            is_checked = self._get_row_value(item_id, 0) == "✓"
             
             # 如果当前值的状态和树视图选择状态不一致，以值的状态为准
             if is_checked != was_selected:
@@ -908,7 +1118,7 @@ class FileManagerPanel(SimplePanel):
             
             # 更新选择标记
             if should_select:
-                values[0] = "✓"
+                self._set_row_value(item_id, 0, "✓")
                 
                 # 提取文件ID并添加到新的选择列表
                 if item_id.startswith("item_"):
@@ -922,12 +1132,9 @@ class FileManagerPanel(SimplePanel):
                 # 设置选中样式
                 self.file_tree.item(item_id, tags=("file", "selected"))
             else:
-                values[0] = ""
+                self._set_row_value(item_id, 0, "")
                 # 清除选中样式
                 self.file_tree.item(item_id, tags=("file",))
-            
-            # 更新树项值
-            self.file_tree.item(item_id, values=values)
         
         # 更新选择状态
         if items_to_select:
@@ -970,10 +1177,7 @@ class FileManagerPanel(SimplePanel):
         # 重置所有项的选择标记和样式
         for item_id in all_items:
             # 清除选择标记
-            values = list(self.file_tree.item(item_id, "values"))
-            if len(values) >= 1:
-                values[0] = ""  # 清除选择标记
-                self.file_tree.item(item_id, values=values)
+            self._set_row_value(item_id, 0, "")
                 
             # 清除选中样式
             self.file_tree.item(item_id, tags=("file",))
@@ -1139,9 +1343,9 @@ class FileManagerPanel(SimplePanel):
                     results[item] = False
                 
                 processed_count += 1
-                
-                # 在主线程中更新进度
-                self.after(0, update_progress)
+            
+            # 每批只刷新一次进度，避免逐项排队重绘
+            update_progress()
             
             # 继续处理下一批或完成
             if processed_count < len(items) and not cancel_requested:
@@ -1214,8 +1418,7 @@ class FileManagerPanel(SimplePanel):
             # 如果点击选择列，切换选择状态
             if column == "#1" and region == "cell":  # #1 表示第一列 (select)
                 # 无需使用修饰键，直接切换选择状态
-                current_values = self.file_tree.item(item, "values")
-                is_selected = current_values[0] == "✓" if len(current_values) > 0 else False
+                is_selected = self._get_row_value(item, 0) == "✓"
                 
                 # 切换选择状态，始终保留现有选择
                 self._toggle_item_selection(item, add_to_selection=True)
@@ -1226,8 +1429,7 @@ class FileManagerPanel(SimplePanel):
             # 对于其他列的点击，允许直接多选
             elif region in ["tree", "cell"]:
                 # 获取树项的值
-                values = self.file_tree.item(item, "values")
-                is_selected = values[0] == "✓" if len(values) > 0 else False
+                is_selected = self._get_row_value(item, 0) == "✓"
                 
                 # 切换选择状态，始终保留现有选择
                 if is_selected:
@@ -1299,9 +1501,7 @@ class FileManagerPanel(SimplePanel):
                 self.file_tree.item(item_id, tags=("file",))
                 
                 # 更新选择列的显示
-                values = list(self.file_tree.item(item_id, "values"))
-                values[0] = ""  # 清除选择标记
-                self.file_tree.item(item_id, values=values)
+                self._set_row_value(item_id, 0, "")  # 清除选择标记
             else:  # 未选中，选中
                 if file_id not in self.selected_files:
                     self.selected_files.append(file_id)
@@ -1313,9 +1513,7 @@ class FileManagerPanel(SimplePanel):
                 self.file_tree.item(item_id, tags=("file", "selected"))
                 
                 # 更新选择列的显示
-                values = list(self.file_tree.item(item_id, "values"))
-                values[0] = "✓"  # 添加选择标记
-                self.file_tree.item(item_id, values=values)
+                self._set_row_value(item_id, 0, "✓")  # 添加选择标记
             
             # 更新状态栏
             self._update_status_bar()
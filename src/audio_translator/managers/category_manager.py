@@ -137,12 +137,36 @@ class CategoryManager:
             messagebox.showerror("错误", "分类服务未初始化")
             return []
         
+        # 移动文件
+        return [target_path for _, target_path in self.move_files_to_category(files, category_id, base_path)]
+    
+    def move_files_to_category(self, files: List[str], 
+                               category_id: str, 
+                               base_path: Union[str, Path]) -> List[Tuple[str, str]]:
+        """
+        将文件移动到指定分类目录
+        
+        不涉及任何UI操作，可以在后台线程中调用。
+        
+        Args:
+            files: 文件列表
+            category_id: 分类ID
+            base_path: 基础路径
+            
+        Returns:
+            成功移动的 (源路径, 目标路径) 列表
+        """
+        if not self.category_service:
+            logger.error("分类服务未设置")
+            return []
+        
         # 确保基础路径存在
-        if isinstance(base_path, str):
-            base_path = Path(base_path)
         os.makedirs(base_path, exist_ok=True)
         
-        # 移动文件
+        # 分类服务支持批量移动时一次完成
+        if hasattr(self.category_service, 'move_files_to_category'):
+            return self.category_service.move_files_to_category(files, category_id, str(base_path))
+        
         moved_files = []
         for file_path in files:
             try:
@@ -152,7 +176,7 @@ class CategoryManager:
                     str(base_path)
                 )
                 if target_path:
-                    moved_files.append(target_path)
+                    moved_files.append((file_path, target_path))
             except Exception as e:
                 logger.error(f"移动文件失败: {file_path}, {e}")
         
@@ -253,7 +277,7 @@ class CategoryManager:
             logger.error("分类服务未设置")
             return False
         
-        return cat_id in self.category_service.get_all_categories()
+        return self.category_service.get_category(cat_id) is not None
     
     def get_all_categories(self) -> Dict[str, Any]:
         """
@@ -268,6 +292,18 @@ class CategoryManager:
         
         return self.category_service.get_all_categories()
     
+    def get_categories_version(self) -> int:
+        """
+        获取分类数据版本号
+        
+        Returns:
+            分类数据版本号，分类服务未设置时返回-1
+        """
+        if not self.category_service:
+            return -1
+        
+        return getattr(self.category_service, 'version', -1)
+    
     def get_subcategories(self, parent_id: str) -> Dict[str, Any]:
         """
         获取子分类
@@ -9,8 +9,7 @@ import os
 import logging
 import threading
 from pathlib import Path
-from typing import List, Tuple, Dict, Optional, Set, Callable, Union
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Tuple, Dict, Optional, Set, Callable, Union, Iterable
 
 # 设置日志记录器
 logger = logging.getLogger(__name__)
@@ -61,6 +60,18 @@ class FileManager:
         # 文件缓存
         self._file_cache = {}
         
+        # 文件缓存对应的 (mtime, size)，用于判断缓存是否仍然有效
+        self._file_stats: Dict[str, Tuple[float, int]] = {}
+        
+        # 每个已加载目录中的文件路径，重新加载时据此清除已删除文件的缓存
+        self._directory_paths: Dict[str, Set[str]] = {}
+        
+        # 状态索引：状态（冒号前部分）-> 文件ID集合，用于按状态过滤时直接取结果
+        self._by_status: Dict[str, Set[str]] = {}
+        
+        # 文件ID -> 在 files 列表中的位置，文件列表重建或重新排序时置为None
+        self._id_index: Optional[Dict[str, int]] = None
+        
         # 已终止标志，用于取消异步操作
         self._terminated = False
         
@@ -87,6 +98,7 @@ class FileManager:
             
             # 清空文件列表
             self.files = []
+            self._id_index = None
             self._loading_callback = callback
             
             # 异步加载大型目录
@@ -124,25 +136,46 @@ class FileManager:
         loaded_files = []
         
         try:
-            # 获取目录中的所有文件
-            file_paths = [os.path.join(directory, f) for f in os.listdir(directory) 
-                         if os.path.isfile(os.path.join(directory, f))]
-            
-            # 使用线程池并行处理文件
-            with ThreadPoolExecutor(max_workers=min(10, os.cpu_count() or 4)) as executor:
-                future_to_path = {executor.submit(self._process_file, file_path): file_path 
-                                for file_path in file_paths}
-                
-                for future in as_completed(future_to_path):
-                    result = future.result()
-                    if result:
-                        loaded_files.append(result)
+            seen_paths = set()
+            
+            # 同一目录下所有文件共用的目录键，以及循环中用到的函数和集合
+            directory_key = os.path.normpath(directory)
+            splitext = os.path.splitext
+            audio_extensions = self.audio_extensions
+            
+            # scandir 的 DirEntry 自带类型信息，stat 结果也会被复用
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if not entry.is_file():
+                            continue
+                        file_type = splitext(entry.name)[1].lower()
+                        if file_type not in audio_extensions:
+                            continue
+                        stat = entry.stat()
+                    except OSError as e:
+                        logger.debug(f"读取文件信息失败: {entry.path}, 错误: {str(e)}")
+                        continue
+                    
+                    file_path = entry.path
+                    seen_paths.add(file_path)
+                    loaded_files.append(self._process_entry(file_path, entry.name, file_type,
+                                                            stat.st_mtime, stat.st_size))
+            
+            # 清除上次加载后已被删除或移走的文件的缓存
+            previous_paths = self._directory_paths.get(directory_key, set())
+            for path in previous_paths - seen_paths:
+                self._file_cache.pop(path, None)
+                self._file_stats.pop(path, None)
+            self._directory_paths[directory_key] = seen_paths
             
             # 应用当前排序规则
             loaded_files = self._sort_files(loaded_files)
             
             # 更新文件列表
             self.files = loaded_files
+            self._id_index = None
+            self._rebuild_status_index()
             
             logger.info(f"已加载目录: {directory}, 共 {len(self.files)} 个文件")
             return self.files
@@ -151,46 +184,32 @@ class FileManager:
             logger.error(f"内部加载文件夹失败: {str(e)}", exc_info=True)
             return []
     
-    def _process_file(self, file_path: str) -> Optional[Tuple[str, str, str, str, str, str]]:
-        """Process a single file to extract metadata.
+    def _process_entry(self, file_path: str, name: str, file_type: str, mtime: float, size: int
+                       ) -> Tuple[str, str, str, str, str, str, str]:
+        """Build the metadata tuple of a file, reusing cached data when still valid.
         
         Args:
             file_path: Path to the file
+            name: File name
+            file_type: Lower-case file extension
+            mtime: Modification time from stat
+            size: File size from stat
             
         Returns:
-            File metadata tuple or None if not a supported audio file
+            File metadata tuple
         """
-        try:
-            # 检查缓存
-            if str(file_path) in self._file_cache:
-                return self._file_cache[str(file_path)]
-                
-            # 处理文件信息
-            name = os.path.basename(file_path)
-            file_type = os.path.splitext(name)[1].lower()
-            
-            # 检查是否为支持的音频文件
-            if file_type not in self.audio_extensions:
-                return None
-            
-            # 获取文件大小
-            size = os.path.getsize(file_path)
-            size_str = self._format_size(size)
-            
-            # 为每个文件分配唯一ID
-            file_id = str(hash(file_path))
-            
-            # 添加翻译名称字段，初始为空字符串
-            translated_name = ""
-            
-            # 缓存结果
-            result = (file_id, name, size_str, file_type, translated_name, "未处理", file_path)
-            self._file_cache[str(file_path)] = result
-            
-            return result
-        except Exception as e:
-            logger.debug(f"处理文件失败: {file_path}, 错误: {str(e)}")
-            return None
+        # 内存缓存保留了本次会话中的状态和翻译结果，文件未变化时直接复用
+        if self._file_stats.get(file_path) == (mtime, size) and file_path in self._file_cache:
+            return self._file_cache[file_path]
+        
+        # 为每个文件分配唯一ID
+        file_id = str(hash(file_path))
+        
+        # 添加翻译名称字段，初始为空字符串
+        result = (file_id, name, self._format_size(size), file_type, "", "未处理", file_path)
+        self._file_cache[file_path] = result
+        self._file_stats[file_path] = (mtime, size)
+        return result
     
     def set_selected_files(self, file_paths: List[str]):
         """Set the currently selected files.
@@ -217,24 +236,18 @@ class FileManager:
         """
         return self.selected_files
     
-    def get_file_info(self, file_path: str) -> Optional[Tuple[str, str, str, str, str, str]]:
+    def get_file_info(self, file_path: str) -> Optional[Tuple[str, str, str, str, str, str, str]]:
         """Get information about a specific file.
         
         Args:
             file_path: Path to the file
             
         Returns:
-            File metadata tuple (name, size_str, file_type, status, file_path) or None if not found
+            File metadata tuple (file_id, name, size_str, file_type, translated_name, status, file_path)
+            or None if not found
         """
-        # 从缓存中获取
-        if file_path in self._file_cache:
-            return self._file_cache[file_path]
-            
-        # 从文件列表中查找
-        for file_info in self.files:
-            if file_info[4] == file_path:
-                return file_info
-        return None
+        # 缓存中保存了所有已加载文件的最新信息
+        return self._file_cache.get(file_path)
     
     def update_file_status(self, file_path: str, status: str):
         """Update the status of a file.
@@ -243,13 +256,8 @@ class FileManager:
             file_path: Path to the file
             status: New status string
         """
-        for i, file_info in enumerate(self.files):
-            if file_info[4] == file_path:
-                # 创建新的元组，更新状态，保留翻译结果
-                self.files[i] = (file_info[0], file_info[1], file_info[2], 
-                               status, file_info[4], file_info[5] if len(file_info) > 5 else "")
-                logger.debug(f"已更新文件状态: {file_path} -> {status}")
-                break
+        if self.batch_update_status([file_path], status):
+            logger.debug(f"已更新文件状态: {file_path} -> {status}")
     
     def update_file_translation(self, file_path: str, translated_name: str) -> bool:
         """
@@ -262,69 +270,66 @@ class FileManager:
         Returns:
             是否更新成功
         """
-        # 更新缓存
-        for i, file_info in enumerate(self.files):
-            if len(file_info) >= 5 and file_info[4] == file_path:
-                # 更新翻译名称
-                # 检查元组长度
-                if len(file_info) >= 6:
-                    # 已有翻译字段，创建新元组
-                    updated_file_info = (
-                        file_info[0],  # name
-                        file_info[1],  # size
-                        file_info[2],  # type
-                        "已翻译",      # status
-                        file_info[4],  # path
-                        translated_name # translated_name
-                    )
-                else:
-                    # 没有翻译字段，扩展元组
-                    updated_file_info = file_info[:4] + ("已翻译", file_info[4], translated_name)
-                
-                # 更新列表项
-                self.files[i] = updated_file_info
-                
-                # 更新缓存
-                self._file_cache[file_path] = updated_file_info
-                
-                return True
-                
-        return False
+        return self.batch_update_translations([file_path], [translated_name]) > 0
+    
+    def _find_index_by_key(self, key: str) -> Optional[int]:
+        """Find the position of a file by its ID or path.
+        
+        Args:
+            key: File ID or file path
+            
+        Returns:
+            Index in self.files, or None if not found
+        """
+        # 路径先经缓存换成文件ID，再通过ID索引定位
+        cached = self._file_cache.get(key)
+        return self._find_file_index(cached[0] if cached else key)
     
     def batch_update_status(self, file_paths: List[str], status: str) -> int:
         """Update the status of multiple files at once.
         
         Args:
-            file_paths: List of file paths to update
+            file_paths: List of file IDs or file paths to update
             status: New status string
             
         Returns:
             Number of files updated
         """
-        count = 0
-        
-        # 创建文件路径到索引的映射以加快查找
-        path_to_index = {file_info[4]: i for i, file_info in enumerate(self.files)}
+        return len(self.batch_update_status_from_paths(file_paths, status))
+    
+    def batch_update_status_from_paths(self, file_paths: Iterable[str], status: str) -> List[str]:
+        """Update the status of multiple files and return the IDs that changed.
         
-        for path in file_paths:
-            if path in path_to_index:
-                index = path_to_index[path]
+        Args:
+            file_paths: File IDs or file paths to update, consumed in a single pass
+            status: New status string
+            
+        Returns:
+            IDs of the files that were updated
+        """
+        updated_ids = []
+        # 只查找需要更新的文件
+        for key in file_paths:
+            index = self._find_index_by_key(key)
+            if index is not None:
                 file_info = self.files[index]
-                # 更新状态，保留翻译结果
-                self.files[index] = (file_info[0], file_info[1], file_info[2], 
-                                  status, file_info[4], file_info[5] if len(file_info) > 5 else "")
-                count += 1
+                # 更新状态，保留其他字段
+                new_info = file_info[:5] + (status,) + file_info[6:]
+                self.files[index] = new_info
+                self._file_cache[str(file_info[6])] = new_info
+                self._update_status_index(file_info[0], file_info[5], status)
+                updated_ids.append(file_info[0])
         
-        if count > 0:
-            logger.debug(f"批量更新了 {count} 个文件状态为: {status}")
+        if updated_ids:
+            logger.debug(f"批量更新了 {len(updated_ids)} 个文件状态为: {status}")
         
-        return count
+        return updated_ids
     
     def batch_update_translations(self, file_paths: List[str], translations: List[str]) -> int:
         """批量更新文件的翻译结果
         
         Args:
-            file_paths: 要更新的文件路径列表
+            file_paths: 要更新的文件ID或文件路径列表
             translations: 对应的翻译结果列表
             
         Returns:
@@ -336,16 +341,15 @@ class FileManager:
             
         count = 0
         
-        # 创建文件路径到索引的映射以加快查找
-        path_to_index = {file_info[4]: i for i, file_info in enumerate(self.files)}
-        
-        for path, translation in zip(file_paths, translations):
-            if path in path_to_index:
-                index = path_to_index[path]
+        for key, translation in zip(file_paths, translations):
+            index = self._find_index_by_key(key)
+            if index is not None:
                 file_info = self.files[index]
-                # 更新翻译结果，保留其他字段
-                self.files[index] = (file_info[0], file_info[1], file_info[2], 
-                                  file_info[3], file_info[4], translation)
+                # 更新翻译结果和状态，保留其他字段
+                new_info = file_info[:4] + (translation, "已翻译") + file_info[6:]
+                self.files[index] = new_info
+                self._file_cache[str(file_info[6])] = new_info
+                self._update_status_index(file_info[0], file_info[5], "已翻译")
                 count += 1
         
         if count > 0:
@@ -353,6 +357,53 @@ class FileManager:
         
         return count
     
+    @staticmethod
+    def _status_key(status: str) -> str:
+        """Get the index key of a status string.
+        
+        Statuses like "已分类: 脚步声" are grouped under the part before the colon.
+        
+        Args:
+            status: Status string
+            
+        Returns:
+            Status key used by the status index
+        """
+        return status.split(":", 1)[0].strip() if status else ""
+    
+    def _rebuild_status_index(self):
+        """Rebuild the status index from the loaded file list."""
+        by_status: Dict[str, Set[str]] = {}
+        for file_info in self.files:
+            by_status.setdefault(self._status_key(file_info[5]), set()).add(file_info[0])
+        self._by_status = by_status
+    
+    def _update_status_index(self, file_id: str, old_status: str, new_status: str):
+        """Move a file between status buckets.
+        
+        Args:
+            file_id: File ID
+            old_status: Previous status string
+            new_status: New status string
+        """
+        old_key = self._status_key(old_status)
+        new_key = self._status_key(new_status)
+        if old_key == new_key:
+            return
+        self._by_status.get(old_key, set()).discard(file_id)
+        self._by_status.setdefault(new_key, set()).add(file_id)
+    
+    def get_file_ids_by_status(self, status: str) -> Set[str]:
+        """Get the IDs of all files with the given status.
+        
+        Args:
+            status: Status string, matched on the part before any colon
+            
+        Returns:
+            Set of file IDs (do not modify)
+        """
+        return self._by_status.get(self._status_key(status), set())
+    
     def filter_files(self, file_type: Optional[str] = None, status: Optional[str] = None) -> List[Tuple[str, str, str, str, str]]:
         """Filter files by type and/or status.
         
@@ -418,6 +469,7 @@ class FileManager:
         
         # 重新排序文件列表
         self.files = self._sort_files(self.files)
+        self._id_index = None
     
     def _sort_files(self, file_list: List[Tuple[str, str, str, str, str, str]]) -> List[Tuple[str, str, str, str, str, str]]:
         """Sort files according to current sorting settings.
@@ -497,6 +549,20 @@ class FileManager:
         
         return stats
     
+    def _find_file_index(self, file_id: str) -> Optional[int]:
+        """Find the position of a file in the file list by its ID.
+        
+        Args:
+            file_id: File ID
+            
+        Returns:
+            Index in self.files, or None if not found
+        """
+        if self._id_index is None:
+            # 索引已失效，按当前文件列表重建
+            self._id_index = {file_info[0]: i for i, file_info in enumerate(self.files)}
+        return self._id_index.get(file_id)
+    
     def get_file_property(self, file_id: str, property_name: str) -> Optional[str]:
         """获取文件的指定属性
         
@@ -525,9 +591,9 @@ class FileManager:
                 return None
             
             # 找到对应的文件
-            for file_info in self.files:
-                if file_info[0] == file_id:
-                    return file_info[property_map[property_name]]
+            index = self._find_file_index(file_id)
+            if index is not None:
+                return self.files[index][property_map[property_name]]
             
             logger.warning(f"找不到ID为 {file_id} 的文件")
             return None
@@ -561,19 +627,23 @@ class FileManager:
                 return False
             
             # 更新文件信息
-            for i, file_info in enumerate(self.files):
-                if file_info[0] == file_id:
-                    # 创建一个新的元组，替换指定位置的值
-                    new_info = list(file_info)
-                    new_info[property_map[property_name]] = value
-                    self.files[i] = tuple(new_info)
-                    
-                    # 更新缓存
-                    file_path = file_info[6]
-                    self._file_cache[str(file_path)] = tuple(new_info)
-                    
-                    logger.debug(f"已更新文件 {file_id} 的 {property_name} 为 {value}")
-                    return True
+            i = self._find_file_index(file_id)
+            if i is not None:
+                file_info = self.files[i]
+                # 创建一个新的元组，替换指定位置的值
+                new_info = list(file_info)
+                new_info[property_map[property_name]] = value
+                self.files[i] = tuple(new_info)
+                
+                if property_name == 'status':
+                    self._update_status_index(file_id, file_info[5], value)
+                
+                # 更新缓存
+                file_path = file_info[6]
+                self._file_cache[str(file_path)] = tuple(new_info)
+                
+                logger.debug(f"已更新文件 {file_id} 的 {property_name} 为 {value}")
+                return True
             
             logger.warning(f"找不到ID为 {file_id} 的文件")
             return False
@@ -24,6 +24,7 @@ class Category:
         synonyms_en: 英文同义词列表
         synonyms_zh: 中文同义词列表
         parent_id: 父分类ID，为空表示根分类
+        count: 该分类下的文件数量，仅用于界面显示，不参与存储
     """
     cat_id: str
     name_en: str
@@ -33,6 +34,7 @@ class Category:
     synonyms_en: List[str] = field(default_factory=list)
     synonyms_zh: List[str] = field(default_factory=list)
     parent_id: str = ""
+    count: int = 0
     
     def to_dict(self) -> Dict[str, Any]:
         """
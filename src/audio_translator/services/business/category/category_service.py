@@ -9,6 +9,7 @@ import os
 import logging
 import csv
 import json
+import shutil
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Any, Set
 from collections import defaultdict
@@ -60,6 +61,12 @@ class CategoryService(BaseService):
         # 匹配缓存
         self._match_cache: Dict[str, str] = {}
         
+        # 子分类缓存，键为父分类ID
+        self._subcategory_cache: Dict[str, Dict[str, Category]] = {}
+        
+        # 分类数据版本号，每次分类数据变化时递增，供调用方判断缓存是否过期
+        self.version = 0
+        
         # 评分规则常量
         self.SCORE_RULES = {
             'EXACT_CATEGORY_SUBCATEGORY': 110,  # 精确匹配分类和子分类
@@ -159,6 +166,8 @@ class CategoryService(BaseService):
         
         try:
             self.categories.clear()
+            self._subcategory_cache.clear()
+            self.version += 1
             
             # 首先检查文件内容
             with open(self.categories_file, 'r', encoding='utf-8', errors='replace') as f:
@@ -236,6 +245,8 @@ class CategoryService(BaseService):
         except Exception as e:
             logger.error(f"加载分类数据失败: {e}")
             self.categories = {}
+            self._subcategory_cache.clear()
+            self.version += 1
             # 创建默认分类
             self._create_default_categories()
     
@@ -256,7 +267,8 @@ class CategoryService(BaseService):
             
             with open(self.categories_file, 'w', encoding='utf-8', newline='') as f:
                 # 定义CSV字段
-                fields = ['CatID', 'Category', 'Category_zh', 'subcategory', 'subcategory_zh', 'synonyms_en', 'synonyms_zh']
+                fields = ['CatID', 'Category', 'Category_zh', 'subcategory', 'subcategory_zh', 'synonyms_en', 'synonyms_zh',
+                          'parent_id']
                 writer = csv.DictWriter(f, fieldnames=fields)
                 writer.writeheader()
                 
@@ -308,37 +320,59 @@ class CategoryService(BaseService):
         if not parent_id:
             logger.warning("父分类ID为空，无法获取子分类")
             return {}
-            
-        subcategories = {}
         
         try:
-            # 首先，尝试通过 parent_id 属性获取子分类
-            for cat_id, category in self.categories.items():
-                if hasattr(category, 'parent_id') and category.parent_id == parent_id:
-                    subcategories[cat_id] = category
-            
-            # 如果通过 parent_id 没有找到任何子分类，尝试通过分类名前缀匹配
-            if not subcategories and parent_id in self.categories:
-                parent_category = self.categories[parent_id]
-                parent_prefix = parent_category.cat_id
-                
-                for cat_id, category in self.categories.items():
-                    # 如果分类ID以父分类ID为前缀，且不是父分类本身
-                    if cat_id != parent_id and cat_id.startswith(f"{parent_prefix}_"):
-                        subcategories[cat_id] = category
-            
-            # 记录日志
-            if subcategories:
-                logger.debug(f"找到父分类 '{parent_id}' 的 {len(subcategories)} 个子分类")
-            else:
-                logger.debug(f"未找到父分类 '{parent_id}' 的子分类")
+            # 缓存为空时一次性建立所有分类的子分类缓存
+            if not self._subcategory_cache:
+                self._build_subcategory_cache()
+            
+            subcategories = self._subcategory_cache.get(parent_id)
+            if subcategories is None:
+                # 不存在的分类没有子分类
+                subcategories = {}
+                self._subcategory_cache[parent_id] = subcategories
                 
-            return subcategories
+            return subcategories.copy()
             
         except Exception as e:
             logger.error(f"获取子分类时出错: {e}, 父分类ID: {parent_id}")
             return {}
     
+    def _build_subcategory_cache(self):
+        """
+        遍历一次所有分类，建立每个分类的子分类缓存
+        
+        子分类优先通过 parent_id 属性确定；没有这类子分类时，
+        使用分类ID以"父分类ID_"为前缀的分类作为子分类。
+        """
+        by_parent: Dict[str, Dict[str, Category]] = {}
+        by_prefix: Dict[str, Dict[str, Category]] = {}
+        
+        for cat_id, category in self.categories.items():
+            parent_id = getattr(category, 'parent_id', None)
+            if parent_id:
+                by_parent.setdefault(parent_id, {})[cat_id] = category
+            
+            # 按ID中每个下划线之前的部分建立前缀索引
+            pos = cat_id.find('_')
+            while pos != -1:
+                by_prefix.setdefault(cat_id[:pos], {})[cat_id] = category
+                pos = cat_id.find('_', pos + 1)
+        
+        cache = dict(by_parent)
+        for cat_id, category in self.categories.items():
+            if cache.get(cat_id):
+                continue
+            parent_prefix = category.cat_id
+            cache[cat_id] = {
+                child_id: child
+                for child_id, child in by_prefix.get(parent_prefix, {}).items()
+                if child_id != cat_id
+            }
+        
+        self._subcategory_cache = cache
+        logger.debug(f"已建立 {len(cache)} 个分类的子分类缓存")
+    
     def add_category(self, category: Category) -> bool:
         """
         添加分类
@@ -361,6 +395,10 @@ class CategoryService(BaseService):
             # 保存分类数据
             self.save_categories()
             
+            # 清除子分类缓存
+            self._subcategory_cache.clear()
+            self.version += 1
+            
             logger.info(f"成功添加分类: {category.cat_id}")
             return True
         except Exception as e:
@@ -399,6 +437,8 @@ class CategoryService(BaseService):
             
             # 清除匹配缓存
             self._match_cache.clear()
+            self._subcategory_cache.clear()
+            self.version += 1
             
             logger.info(f"成功更新分类: {cat_id} -> {category.cat_id}")
             return True
@@ -430,6 +470,8 @@ class CategoryService(BaseService):
             
             # 清除匹配缓存
             self._match_cache.clear()
+            self._subcategory_cache.clear()
+            self.version += 1
             
             logger.info(f"成功删除分类: {cat_id}")
             return True
@@ -616,7 +658,6 @@ class CategoryService(BaseService):
                     counter += 1
             
             # 移动文件
-            import shutil
             shutil.move(file_path, target_path)
             
             logger.info(f"成功移动文件: {file_path} -> {target_path}")
@@ -625,6 +666,64 @@ class CategoryService(BaseService):
             logger.error(f"移动文件失败: {e}")
             return None
     
+    def move_files_to_category(self, file_paths: List[str], cat_id: str, base_path: str) -> List[Tuple[str, str]]:
+        """
+        批量将文件移动到分类目录
+        
+        分类目录只计算和创建一次。源文件与分类目录位于同一设备时直接重命名，
+        跨设备时才回退到 shutil.move 复制后删除。
+        
+        Args:
+            file_paths: 文件路径列表
+            cat_id: 分类ID
+            base_path: 基础路径
+            
+        Returns:
+            成功移动的 (源路径, 目标路径) 列表
+        """
+        moved = []
+        
+        try:
+            # 获取并创建分类目录
+            cat_path = self.get_category_path(cat_id, base_path)
+            os.makedirs(cat_path, exist_ok=True)
+            cat_dev = os.stat(cat_path).st_dev
+        except Exception as e:
+            logger.error(f"创建分类目录失败: {e}")
+            return moved
+        
+        for file_path in file_paths:
+            try:
+                try:
+                    src_dev = os.stat(file_path).st_dev
+                except FileNotFoundError:
+                    logger.error(f"文件不存在: {file_path}")
+                    continue
+                
+                # 构建目标路径，目标文件已存在时添加数字后缀
+                file_name = os.path.basename(file_path)
+                target_path = os.path.join(cat_path, file_name)
+                if os.path.exists(target_path):
+                    logger.warning(f"目标文件已存在: {target_path}")
+                    name, ext = os.path.splitext(file_name)
+                    counter = 1
+                    while os.path.exists(target_path):
+                        target_path = os.path.join(cat_path, f"{name}_{counter}{ext}")
+                        counter += 1
+                
+                # 同一设备上只需更新目录项
+                if src_dev == cat_dev:
+                    os.rename(file_path, target_path)
+                else:
+                    shutil.move(file_path, target_path)
+                
+                moved.append((file_path, target_path))
+            except Exception as e:
+                logger.error(f"移动文件失败: {file_path}, {e}")
+        
+        logger.info(f"已将 {len(moved)}/{len(file_paths)} 个文件移动到分类 {cat_id}")
+        return moved
+    
     def get_categories_for_ui(self, search_term: str = "", language: str = "zh") -> List[Dict[str, Any]]:
         """
         获取用于UI显示的分类列表
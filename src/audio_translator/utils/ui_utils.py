@@ -5,7 +5,10 @@ UI工具函数和类
 
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional, Callable, Any, Dict
+from typing import Optional, Callable, Any, Dict, Iterable, Tuple
+
+# 批量插入Treeview行的Tcl匿名函数，参数为控件路径和行参数列表
+_BULK_INSERT_LAMBDA = "{w rows} {foreach row $rows {$w insert {*}$row}}"
 
 
 def create_tooltip(widget, text: str) -> None:
@@ -152,4 +155,34 @@ def create_form_field(parent, label_text: str, var,
         if tooltip:
             create_tooltip(widget, tooltip)
     
-    return widget 
\ No newline at end of file
+    return widget
+
+
+def treeview_bulk_insert(tree: ttk.Treeview,
+                         rows: Iterable[Tuple[str, str, Dict[str, Any]]]) -> int:
+    """
+    通过单次Tcl调用批量插入Treeview行
+    
+    逐行调用 Treeview.insert 时每一行都是一次独立的Tcl命令分派，
+    行数较多时这部分开销占主导。此函数把所有行打包成一个Tcl列表，
+    由Tcl侧循环插入，整批只跨越一次Python/Tcl边界。
+    
+    Args:
+        tree: 目标Treeview
+        rows: (parent, iid, options) 序列，options 对应 Treeview.insert 的关键字参数，
+              如 text、values、tags、open
+    
+    Returns:
+        插入的行数
+    """
+    commands = []
+    for parent, iid, options in rows:
+        words = [parent, "end", "-id", iid]
+        for key, value in options.items():
+            words.append(f"-{key}")
+            words.append(value)
+        commands.append(tuple(words))
+    
+    if commands:
+        tree.tk.call("apply", _BULK_INSERT_LAMBDA, str(tree), tuple(commands))
+    return len(commands)
@@ -0,0 +1,150 @@
+"""
+主窗口分类树操作测试模块
+
+在不创建Tk窗口的情况下测试分类树相关的事件处理函数。
+"""
+
+import unittest
+from unittest.mock import MagicMock, patch
+import sys
+import os
+import time
+import logging
+import tempfile
+import shutil
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# 添加项目根目录到模块搜索路径
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, project_root)
+
+from src.audio_translator.gui import main_window
+from src.audio_translator.gui.main_window import AudioTranslatorGUI
+from src.audio_translator.services.business.category.category_service import CategoryService
+
+# 禁用日志输出，避免测试时的噪音
+logging.disable(logging.CRITICAL)
+
+
+class TestAddSubcategory(unittest.TestCase):
+    """添加子分类处理函数测试类"""
+    
+    def setUp(self):
+        """跳过 __init__ 创建主窗口，只设置处理函数用到的属性"""
+        self.gui = AudioTranslatorGUI.__new__(AudioTranslatorGUI)
+        self.gui.root = MagicMock()
+        self.gui.category_tree = MagicMock()
+        self.gui.category_tree.item.return_value = "音效"
+        self.gui.category_tree.insert.return_value = "new_node"
+        self.gui.category_service = MagicMock()
+        self.gui.category_service.get_category.return_value = None
+        self.gui._cat_name_index = {"parent_node": {"爆炸": "existing_node"}}
+        self.gui._node_cat_ids = {"parent_node": "SFX", "existing_node": "SFX_爆炸"}
+        self.gui._lazy_nodes = {}
+    
+    @patch.object(AudioTranslatorGUI, "_run_category_op")
+    @patch.object(main_window, "messagebox")
+    @patch.object(main_window, "simpledialog")
+    def test_duplicate_subcategory_rejected(self, mock_dialog, mock_messagebox, mock_run_op):
+        """测试子分类名称已存在时显示错误且不调用分类服务"""
+        mock_dialog.askstring.return_value = "爆炸"
+        
+        self.gui._on_add_subcategory("parent_node")
+        
+        mock_messagebox.showerror.assert_called_once()
+        mock_run_op.assert_not_called()
+        self.gui.category_service.add_category.assert_not_called()
+        self.gui.category_tree.insert.assert_not_called()
+    
+    @patch.object(AudioTranslatorGUI, "_notify")
+    @patch.object(AudioTranslatorGUI, "_run_category_op")
+    @patch.object(main_window, "messagebox")
+    @patch.object(main_window, "simpledialog")
+    def test_new_subcategory_inserted(self, mock_dialog, mock_messagebox, mock_run_op, mock_notify):
+        """测试添加成功后插入分类树行并更新名称索引"""
+        mock_dialog.askstring.return_value = "枪声"
+        
+        self.gui._on_add_subcategory("parent_node")
+        
+        mock_messagebox.showerror.assert_not_called()
+        mock_run_op.assert_called_once()
+        service, method_name, args, on_success, _ = mock_run_op.call_args[0]
+        self.assertIs(service, self.gui.category_service)
+        self.assertEqual(method_name, "add_category")
+        self.assertEqual(args[0].cat_id, "SFX_枪声")
+        self.assertEqual(args[0].parent_id, "SFX")
+        
+        # 模拟后台调用成功后的回调
+        on_success()
+        
+        self.gui.category_tree.insert.assert_called_once_with(
+            "parent_node", "end", text="枪声", values=(0,))
+        self.assertEqual(self.gui._cat_name_index["parent_node"]["枪声"], "new_node")
+        self.assertEqual(self.gui._node_cat_ids["new_node"], "SFX_枪声")
+        mock_notify.assert_called_once()
+
+
+
+class TestAddSubcategoryWithService(unittest.TestCase):
+    """使用临时目录中的真实分类服务测试添加子分类"""
+    
+    def setUp(self):
+        """创建只包含一个分类的分类文件，并设置处理函数用到的属性"""
+        self.temp_dir = tempfile.mkdtemp()
+        categories_file = Path(self.temp_dir) / "_categorylist.csv"
+        categories_file.write_text(
+            "CatID,Category,Category_zh,subcategory,subcategory_zh,synonyms_en,synonyms_zh\n"
+            "AIRBlow,AIR,空气,BLOW,吹,[],[]\n",
+            encoding="utf-8"
+        )
+        self.service = CategoryService()
+        self.service.categories_file = categories_file
+        self.service._load_categories()
+        
+        self.gui = AudioTranslatorGUI.__new__(AudioTranslatorGUI)
+        self.gui.root = MagicMock()
+        # 定时回调在等待指定时间后直接执行，使后台操作的轮询同步完成
+        self.gui.root.after.side_effect = lambda ms, func, *args: (time.sleep(ms / 1000), func(*args))
+        self.gui.category_tree = MagicMock()
+        self.gui.category_tree.item.return_value = "空气"
+        self.gui.category_tree.insert.return_value = "new_node"
+        self.gui.category_service = self.service
+        self.gui._cat_name_index = {"parent_node": {}}
+        self.gui._node_cat_ids = {"parent_node": "AIRBlow"}
+        self.gui._lazy_nodes = {}
+        self.gui._subcategory_snapshot = {}
+        self.gui._category_executor = ThreadPoolExecutor(max_workers=1)
+    
+    def tearDown(self):
+        """关闭后台线程并删除临时目录"""
+        self.gui._category_executor.shutdown(wait=True)
+        shutil.rmtree(self.temp_dir)
+    
+    @patch.object(AudioTranslatorGUI, "_notify")
+    @patch.object(main_window, "messagebox")
+    @patch.object(main_window, "simpledialog")
+    def test_subcategory_persisted_and_inserted(self, mock_dialog, mock_messagebox, mock_notify):
+        """测试子分类保存到分类文件并插入分类树"""
+        mock_dialog.askstring.return_value = "阵风"
+        
+        self.gui._on_add_subcategory("parent_node")
+        
+        mock_messagebox.showerror.assert_not_called()
+        self.gui.category_tree.insert.assert_called_once_with(
+            "parent_node", "end", text="阵风", values=(0,))
+        self.assertEqual(self.gui._node_cat_ids["new_node"], "AIRBlow_阵风")
+        
+        # 重新从分类文件加载，确认子分类已保存
+        reloaded = CategoryService()
+        reloaded.categories_file = self.service.categories_file
+        reloaded._load_categories()
+        subcategory = reloaded.get_category("AIRBlow_阵风")
+        self.assertIsNotNone(subcategory)
+        self.assertEqual(subcategory.name_zh, "阵风")
+        self.assertEqual(subcategory.parent_id, "AIRBlow")
+        self.assertIn("AIRBlow_阵风", reloaded.get_subcategories("AIRBlow"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,183 @@
+"""
+FileManager 测试模块
+
+测试文件管理器的各项功能，包括：
+- 重新加载目录时的文件信息缓存
+- 状态索引和文件ID索引
+"""
+
+import unittest
+import os
+import sys
+import logging
+import tempfile
+import shutil
+
+# 添加项目根目录到模块搜索路径
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../..'))
+sys.path.insert(0, project_root)
+
+from src.audio_translator.managers.file_manager import FileManager
+
+# 禁用日志输出，避免测试时的噪音
+logging.disable(logging.CRITICAL)
+
+
+class FileManagerTestCase(unittest.TestCase):
+    """在临时目录中创建音频文件的测试基类"""
+    
+    def setUp(self):
+        """创建临时目录和文件管理器"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.file_manager = FileManager()
+    
+    def tearDown(self):
+        """删除临时目录"""
+        shutil.rmtree(self.temp_dir)
+    
+    def create_file(self, name, size=100):
+        """在临时目录中创建指定大小的文件"""
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'wb') as f:
+            f.write(b'\0' * size)
+        return path
+    
+    def load(self):
+        """同步加载临时目录，返回 路径 -> 文件信息 的字典"""
+        files = self.file_manager.load_directory(self.temp_dir)
+        return {file_info[6]: file_info for file_info in files}
+
+
+class TestFileCache(FileManagerTestCase):
+    """重新加载目录时的文件信息缓存测试类"""
+    
+    def test_unchanged_file_reuses_cached_info(self):
+        """测试文件未变化时重新加载保留本次会话中的翻译结果"""
+        path = self.create_file("a.wav")
+        first = self.load()[path]
+        self.file_manager.update_file_translation(path, "译名")
+        
+        reloaded = self.load()[path]
+        
+        self.assertEqual(reloaded[0], first[0])
+        self.assertEqual(reloaded[4], "译名")
+        self.assertEqual(reloaded[5], "已翻译")
+    
+    def test_size_change_invalidates_cache(self):
+        """测试文件大小变化后重新生成文件信息"""
+        path = self.create_file("a.wav", size=100)
+        self.load()
+        self.file_manager.update_file_translation(path, "译名")
+        stat = os.stat(path)
+        
+        # 保持修改时间不变，只改变大小
+        self.create_file("a.wav", size=4096)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        reloaded = self.load()[path]
+        
+        self.assertEqual(reloaded[2], "4.0 KB")
+        self.assertEqual(reloaded[4], "")
+        self.assertEqual(reloaded[5], "未处理")
+    
+    def test_mtime_change_invalidates_cache(self):
+        """测试文件修改时间变化后重新生成文件信息"""
+        path = self.create_file("a.wav")
+        self.load()
+        self.file_manager.update_file_status(path, "已分类: 环境")
+        
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime + 10, stat.st_mtime + 10))
+        reloaded = self.load()[path]
+        
+        self.assertEqual(reloaded[5], "未处理")
+    
+    def test_deleted_file_removed_from_cache(self):
+        """测试文件删除后重新加载时从缓存中移除"""
+        kept = self.create_file("a.wav")
+        removed = self.create_file("b.wav")
+        self.load()
+        
+        os.remove(removed)
+        files = self.load()
+        
+        self.assertIn(kept, files)
+        self.assertNotIn(removed, files)
+        self.assertIsNone(self.file_manager.get_file_info(removed))
+        self.assertIsNotNone(self.file_manager.get_file_info(kept))
+
+
+
+class TestFileIndexes(FileManagerTestCase):
+    """状态索引和文件ID索引测试类"""
+    
+    def setUp(self):
+        """创建三个文件并加载目录"""
+        super().setUp()
+        self.paths = [self.create_file(name) for name in ("a.wav", "b.mp3", "c.flac")]
+        self.ids = {path: file_info[0] for path, file_info in self.load().items()}
+    
+    def assert_index_consistent(self):
+        """检查两个索引都与文件列表一致"""
+        files = self.file_manager.get_files()
+        for i, file_info in enumerate(files):
+            self.assertEqual(self.file_manager._find_file_index(file_info[0]), i)
+            self.assertEqual(self.file_manager._find_index_by_key(file_info[6]), i)
+            self.assertIn(file_info[0], self.file_manager.get_file_ids_by_status(file_info[5]))
+        indexed_ids = set().union(*self.file_manager._by_status.values())
+        self.assertEqual(indexed_ids, {file_info[0] for file_info in files})
+    
+    def test_loaded_files_indexed_as_unprocessed(self):
+        """测试加载后所有文件都在未处理状态下"""
+        self.assertEqual(self.file_manager.get_file_ids_by_status("未处理"), set(self.ids.values()))
+        self.assert_index_consistent()
+    
+    def test_status_update_moves_files_between_buckets(self):
+        """测试状态更新后文件移动到新状态下，带冒号的状态按冒号前部分归类"""
+        path = self.paths[0]
+        updated = self.file_manager.batch_update_status_from_paths([path], "已分类: 环境")
+        
+        self.assertEqual(updated, [self.ids[path]])
+        self.assertEqual(self.file_manager.get_file_ids_by_status("已分类"), {self.ids[path]})
+        self.assertEqual(self.file_manager.get_file_ids_by_status("已分类: 脚步声"), {self.ids[path]})
+        self.assertNotIn(self.ids[path], self.file_manager.get_file_ids_by_status("未处理"))
+        self.assert_index_consistent()
+    
+    def test_update_by_file_id(self):
+        """测试按文件ID更新状态"""
+        file_id = self.ids[self.paths[1]]
+        self.assertTrue(self.file_manager.update_file_property(file_id, "status", "处理中"))
+        
+        self.assertEqual(self.file_manager.get_file_ids_by_status("处理中"), {file_id})
+        self.assert_index_consistent()
+    
+    def test_translation_batch_marks_files_translated(self):
+        """测试批量翻译后文件归入已翻译状态"""
+        count = self.file_manager.batch_update_translations(self.paths[:2], ["甲", "乙"])
+        
+        self.assertEqual(count, 2)
+        self.assertEqual(self.file_manager.get_file_ids_by_status("已翻译"),
+                         {self.ids[self.paths[0]], self.ids[self.paths[1]]})
+        self.assertEqual(self.file_manager.get_file_ids_by_status("未处理"), {self.ids[self.paths[2]]})
+        self.assertEqual(self.file_manager.get_file_info(self.paths[0])[4], "甲")
+        self.assert_index_consistent()
+    
+    def test_indexes_after_sorting(self):
+        """测试重新排序后文件ID索引仍然正确"""
+        self.file_manager.set_sorting(1, reverse=True)
+        self.assert_index_consistent()
+    
+    def test_removed_file_dropped_from_indexes(self):
+        """测试文件删除并重新加载后从两个索引中移除"""
+        removed = self.paths[0]
+        self.file_manager.update_file_status(removed, "已分类: 环境")
+        os.remove(removed)
+        self.load()
+        
+        self.assertIsNone(self.file_manager._find_file_index(self.ids[removed]))
+        self.assertIsNone(self.file_manager._find_index_by_key(removed))
+        self.assertEqual(self.file_manager.get_file_ids_by_status("已分类"), set())
+        self.assert_index_consistent()
+
+
+if __name__ == '__main__':
+    unittest.main()
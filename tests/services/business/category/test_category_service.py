@@ -0,0 +1,201 @@
+"""
+CategoryService 测试模块
+
+测试CategoryService的各项功能，包括：
+- 子分类缓存及其失效
+- 批量移动文件到分类目录
+"""
+
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import logging
+import tempfile
+import shutil
+from pathlib import Path
+
+# 添加项目根目录到模块搜索路径
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../../..'))
+sys.path.insert(0, project_root)
+
+from src.audio_translator.services.business.category import category_service as category_service_module
+from src.audio_translator.services.business.category.category import Category
+from src.audio_translator.services.business.category.category_service import CategoryService
+
+# 禁用日志输出，避免测试时的噪音
+logging.disable(logging.CRITICAL)
+
+
+def linear_subcategories(categories, parent_id):
+    """逐个遍历分类查找子分类，作为子分类缓存的对照结果"""
+    subcategories = {cat_id: category for cat_id, category in categories.items()
+                     if category.parent_id == parent_id}
+    if not subcategories and parent_id in categories:
+        prefix = f"{categories[parent_id].cat_id}_"
+        subcategories = {cat_id: category for cat_id, category in categories.items()
+                         if cat_id != parent_id and cat_id.startswith(prefix)}
+    return subcategories
+
+
+class CategoryServiceTestCase(unittest.TestCase):
+    """使用临时分类文件的测试基类"""
+    
+    def setUp(self):
+        """创建临时目录，分类数据保存到其中的分类文件"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.service = CategoryService()
+        self.service.categories_file = Path(self.temp_dir) / "_categorylist.csv"
+        for category in (
+            Category("AIR", "Air", "空气"),
+            Category("AIR_Blow", "Air", "空气", "Blow", "吹"),
+            Category("AIR_Blow_Soft", "Air", "空气", "Soft", "轻吹"),
+            Category("DOOR", "Door", "门"),
+            Category("DOORWood", "Door", "门", "Wood", "木门", parent_id="DOOR"),
+            Category("DOOR_Metal", "Door", "门", "Metal", "金属门"),
+            Category("ORPHAN", "Orphan", "孤立", parent_id="MISSING"),
+        ):
+            self.service.categories[category.cat_id] = category
+    
+    def tearDown(self):
+        """删除临时目录"""
+        shutil.rmtree(self.temp_dir)
+
+
+class TestSubcategoryCache(CategoryServiceTestCase):
+    """子分类缓存测试类"""
+    
+    def assert_matches_linear_scan(self):
+        """检查所有分类ID以及不存在的父分类的查询结果都与逐个遍历一致"""
+        parent_ids = list(self.service.categories) + ["MISSING", "UNKNOWN"]
+        for parent_id in parent_ids:
+            self.assertEqual(self.service.get_subcategories(parent_id),
+                             linear_subcategories(self.service.categories, parent_id),
+                             parent_id)
+    
+    def test_matches_linear_scan(self):
+        """测试缓存结果与逐个遍历的结果一致"""
+        self.assert_matches_linear_scan()
+        self.assertEqual(set(self.service.get_subcategories("DOOR")), {"DOORWood"})
+        self.assertEqual(set(self.service.get_subcategories("AIR")), {"AIR_Blow", "AIR_Blow_Soft"})
+    
+    def test_returned_dict_is_a_copy(self):
+        """测试修改返回的字典不影响缓存"""
+        self.service.get_subcategories("AIR").clear()
+        self.assertEqual(len(self.service.get_subcategories("AIR")), 2)
+    
+    def test_add_invalidates_cache(self):
+        """测试添加分类后缓存失效且版本号递增"""
+        self.service.get_subcategories("DOOR")
+        version = self.service.version
+        
+        self.assertTrue(self.service.add_category(Category("DOORGlass", "Door", "门", parent_id="DOOR")))
+        
+        self.assertGreater(self.service.version, version)
+        self.assertIn("DOORGlass", self.service.get_subcategories("DOOR"))
+        self.assert_matches_linear_scan()
+    
+    def test_update_invalidates_cache(self):
+        """测试更新分类（包括修改分类ID）后缓存失效且版本号递增"""
+        self.service.get_subcategories("AIR")
+        version = self.service.version
+        
+        self.assertTrue(self.service.update_category(
+            "AIR_Blow", Category("AIR_Gust", "Air", "空气", "Gust", "阵风")))
+        
+        self.assertGreater(self.service.version, version)
+        self.assertEqual(set(self.service.get_subcategories("AIR")), {"AIR_Gust", "AIR_Blow_Soft"})
+        self.assert_matches_linear_scan()
+    
+    def test_delete_invalidates_cache(self):
+        """测试删除分类后缓存失效且版本号递增"""
+        self.service.get_subcategories("DOOR")
+        version = self.service.version
+        
+        self.assertTrue(self.service.delete_category("DOORWood"))
+        
+        self.assertGreater(self.service.version, version)
+        # 没有 parent_id 子分类时改为按ID前缀查找
+        self.assertEqual(set(self.service.get_subcategories("DOOR")), {"DOOR_Metal"})
+        self.assert_matches_linear_scan()
+
+
+class TestMoveFilesToCategory(CategoryServiceTestCase):
+    """批量移动文件到分类目录测试类"""
+    
+    def setUp(self):
+        """在临时目录中创建源目录和待移动的文件"""
+        super().setUp()
+        self.source_dir = os.path.join(self.temp_dir, "source")
+        self.base_path = os.path.join(self.temp_dir, "sorted")
+        os.makedirs(self.source_dir)
+        self.files = []
+        for name in ("a.wav", "b.wav"):
+            path = os.path.join(self.source_dir, name)
+            with open(path, 'wb') as f:
+                f.write(name.encode())
+            self.files.append(path)
+        self.category_dir = os.path.join(self.base_path, "AIR", "AIR_Blow")
+    
+    def test_same_device_batch(self):
+        """测试同一设备上直接重命名，返回每个文件的源路径和目标路径"""
+        with patch.object(category_service_module.shutil, "move") as mock_move:
+            moved = self.service.move_files_to_category(self.files, "AIR_Blow", self.base_path)
+        
+        mock_move.assert_not_called()
+        expected = [(path, os.path.join(self.category_dir, os.path.basename(path))) for path in self.files]
+        self.assertEqual(moved, expected)
+        for source, target in moved:
+            self.assertFalse(os.path.exists(source))
+            self.assertTrue(os.path.exists(target))
+    
+    def test_cross_device_uses_shutil_move(self):
+        """测试源文件与分类目录不在同一设备时使用 shutil.move"""
+        real_stat = os.stat
+        sources = set(self.files)
+        
+        class OtherDeviceStat:
+            """设备号与实际不同的 stat 结果"""
+            def __init__(self, st):
+                self._st = st
+                self.st_dev = st.st_dev + 1
+            
+            def __getattr__(self, name):
+                return getattr(self._st, name)
+        
+        def fake_stat(path, *args, **kwargs):
+            st = real_stat(path, *args, **kwargs)
+            return OtherDeviceStat(st) if path in sources else st
+        
+        with patch.object(category_service_module.os, "stat", side_effect=fake_stat), \
+                patch.object(category_service_module.shutil, "move", wraps=shutil.move) as mock_move:
+            moved = self.service.move_files_to_category(self.files, "AIR_Blow", self.base_path)
+        
+        self.assertEqual(mock_move.call_count, len(self.files))
+        self.assertEqual([source for source, _ in moved], self.files)
+        for _, target in moved:
+            self.assertTrue(os.path.exists(target))
+    
+    def test_missing_source_skipped(self):
+        """测试源文件不存在时跳过该文件，其余文件仍被移动"""
+        os.remove(self.files[0])
+        
+        moved = self.service.move_files_to_category(self.files, "AIR_Blow", self.base_path)
+        
+        self.assertEqual(moved, [(self.files[1], os.path.join(self.category_dir, "b.wav"))])
+        self.assertTrue(os.path.exists(os.path.join(self.category_dir, "b.wav")))
+        self.assertFalse(os.path.exists(os.path.join(self.category_dir, "a.wav")))
+    
+    def test_existing_target_gets_suffix(self):
+        """测试目标文件已存在时添加数字后缀"""
+        os.makedirs(self.category_dir)
+        with open(os.path.join(self.category_dir, "a.wav"), 'wb') as f:
+            f.write(b"existing")
+        
+        moved = self.service.move_files_to_category(self.files[:1], "AIR_Blow", self.base_path)
+        
+        self.assertEqual(moved, [(self.files[0], os.path.join(self.category_dir, "a_1.wav"))])
+
+
+if __name__ == '__main__':
+    unittest.main()